@@ -1,34 +1,559 @@
-import tkinter as tk
-from tkinter import messagebox
+import time
+STARTUP_T0 = time.perf_counter()  # awal pengukuran startup (sebelum import lain)
+try:
+    import tkinter as tk
+except ImportError:  # build server tanpa python3-tk: engine & perintah headless tetap jalan
+    tk = None
 import random
+import sys
+import json
+import heapq
+import math
+import struct
+import importlib.util
+from array import array
+import os
+import sqlite3
+import threading
+import queue
+import uuid
+from contextlib import contextmanager
+from functools import wraps
+from collections import OrderedDict, deque, namedtuple
+
+# Modul berat (numpy, asyncio, argparse, concurrent.futures, csv, statistics, ...) diimpor
+# di dalam fungsi yang memakainya supaya tidak memperlambat jendela pertama.
 
 # Multi-game app: Ular Tangga, Tic Tac Toe, Soal Hitung
 # Fitur:
-# - Navigasi antar permainan tanpa menutup program (game lama di-destroy, tidak numpuk)
+# - Navigasi antar permainan tanpa menutup program (view disimpan di cache LRU, state permainan tetap)
 # - Fullscreen (F11 untuk toggle, Esc untuk keluar)
 # - Background gradasi warna yang memenuhi layar dan tidak tembus saat fullscreen
 # - Ular Tangga responsif: papan otomatis menyesuaikan ukuran agar bagian bawah tidak tertutup
 # - Saat pemain selesai lempar dadu, ada penanda visual di token pemain (highlight) selama singkat
+# - Papan Ular Tangga tambahan dari file JSON di folder boards/ (hingga 30x30, 8 pemain)
+# - F12: overlay profiling (p50/p95 waktu render & lag event loop), Ctrl+F12: simpan sampel ke file
+# - Main online Ular Tangga / Tic Tac Toe antar komputer lewat server relay (serve, --connect)
+# - Game tambahan dari folder plugins/ atau entry point, diimpor saat pertama dibuka
+# - Notifikasi (menang, input salah) berupa toast di dalam jendela, bukan dialog modal
+# - Turnamen bot vs bot paralel (proses terpisah) dengan dashboard statistik langsung
 
 APP_W, APP_H = 900, 650
+RESIZE_DEBOUNCE_MS = 60  # jeda sebelum relayout setelah burst event <Configure>
+SNAKES_MIN_BOARD_PX = 200  # papan Ular Tangga tidak diperkecil di bawah ini
+SNAKES_MIN_CELL_PX = 10
+AI_MOVE_DELAY_MS = 250  # jeda kecil agar langkah komputer terlihat
+ANIM_FPS = 50
+ANIM_STEP_MS = 80  # durasi token berpindah satu kotak
+ANIM_JUMP_MS = 400  # durasi naik tangga / turun ular
+PROFILE_WINDOW = 2000  # sampel per metrik yang disimpan
+PROFILE_REFRESH_MS = 500
+LAG_PROBE_MS = 50
+TTT_CANVAS_MIN_SIZE = 6  # mulai ukuran ini papan Tic Tac Toe digambar di canvas
+TTT_CANVAS_PX = 540
+VIEW_CACHE_SIZE = None  # view (menu + game) yang disimpan tersembunyi; None = semua game di registry
+VIEW_CACHE_BUDGET = 2000  # perkiraan biaya memori: jumlah widget + item canvas
+STORE_FLUSH_S = 0.5  # penulisan ke SQLite dikumpulkan paling lama selama ini
+STORE_BATCH = 500
+TOAST_MS = 2500  # lama toast tampil sebelum hilang sendiri
+TOAST_MAX_VISIBLE = 3  # toast yang tampil bersamaan; sisanya antre
+TOAST_QUEUE_MAX = 20  # antrean penuh: toast tertua dibuang
+TOAST_SPACING_PX = 44
+STARTUP_FALLBACK_MS = 300  # jalankan pekerjaan tertunda walau <Expose> pertama tidak pernah datang
+STARTUP_BUDGETS = {"startup_first_paint": 250, "startup_interactive": 600}  # ms, dicek oleh bench
+
+# ---------------------------
+# Profiling (waktu render, pembuatan view, lag event loop)
+# ---------------------------
+
+def percentile(values, q):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q / 100 * len(ordered)))]
+
+class Profiler:
+    def __init__(self, window=PROFILE_WINDOW):
+        self.enabled = False
+        self.window = window
+        self.samples = {}  # nama -> deque[(timestamp, ms)]
+        self.lag_job = None
+
+    def record(self, name, ms):
+        if name not in self.samples:
+            self.samples[name] = deque(maxlen=self.window)
+        self.samples[name].append((time.time(), ms))
+
+    @contextmanager
+    def measure(self, name):
+        if not self.enabled:
+            yield
+            return
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, (time.perf_counter() - t0) * 1000)
+
+    def summary(self):
+        rows = []
+        for name, samples in sorted(self.samples.items()):
+            values = [ms for _, ms in samples]
+            rows.append((name, len(values), percentile(values, 50), percentile(values, 95)))
+        return rows
+
+    def start_lag_probe(self, widget):
+        # Lag = seberapa telat callback after() dijalankan dibanding jadwalnya
+        def probe(expected):
+            now = time.perf_counter()
+            self.record("event_lag", max(0.0, (now - expected) * 1000))
+            self.lag_job = widget.after(LAG_PROBE_MS, probe, now + LAG_PROBE_MS / 1000)
+        self.stop_lag_probe(widget)
+        self.lag_job = widget.after(LAG_PROBE_MS, probe, time.perf_counter() + LAG_PROBE_MS / 1000)
+
+    def stop_lag_probe(self, widget):
+        if self.lag_job is not None:
+            widget.after_cancel(self.lag_job)
+            self.lag_job = None
+
+    def dump(self, path):
+        # Format mengikuti ekstensi: .csv atau .json
+        if path.endswith(".csv"):
+            import csv
+            with open(path, "w", newline="", encoding="utf-8") as f:
+                writer = csv.writer(f)
+                writer.writerow(["metric", "timestamp", "ms"])
+                for name, samples in self.samples.items():
+                    for ts, ms in samples:
+                        writer.writerow([name, f"{ts:.6f}", f"{ms:.3f}"])
+        else:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump({name: list(samples) for name, samples in self.samples.items()}, f)
+        return path
+
+PROFILER = Profiler()
+
+def profiled(name):
+    def decorate(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not PROFILER.enabled:
+                return fn(*args, **kwargs)
+            with PROFILER.measure(name):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorate
+
+class ProfilerOverlay:
+    def __init__(self, root, profiler=PROFILER):
+        self.root = root
+        self.profiler = profiler
+        self.label = None  # dibuat saat overlay pertama kali dipakai, bukan saat startup
+        self.job = None
+
+    def ensure_label(self):
+        if self.label is None:
+            self.label = tk.Label(self.root, text="", font=("Courier", 10), justify="left", anchor="nw",
+                                  fg="#00ff88", bg="#000000", padx=6, pady=4)
+        return self.label
+
+    def toggle(self, event=None):
+        if self.profiler.enabled:
+            self.profiler.enabled = False
+            self.profiler.stop_lag_probe(self.root)
+            if self.job is not None:
+                self.root.after_cancel(self.job)
+                self.job = None
+            self.ensure_label().place_forget()
+        else:
+            self.profiler.enabled = True
+            self.profiler.start_lag_probe(self.root)
+            self.ensure_label().place(x=8, y=8)
+            self.label.lift()
+            self.refresh()
+
+    def refresh(self):
+        lines = [f"{'metrik':<16}{'n':>6}{'p50 ms':>9}{'p95 ms':>9}"]
+        for name, n, p50, p95 in self.profiler.summary():
+            lines.append(f"{name:<16}{n:>6}{p50:>9.2f}{p95:>9.2f}")
+        self.ensure_label().config(text="\n".join(lines))
+        self.job = self.root.after(PROFILE_REFRESH_MS, self.refresh)
+
+    def dump(self, event=None):
+        path = self.profiler.dump(time.strftime("profile-%Y%m%d-%H%M%S.json"))
+        self.ensure_label().config(text=f"Sampel disimpan: {path}")
 
 # ---------------------------
 # Shared UI helpers
 # ---------------------------
 
-def paint_gradient(canvas):
-    colors = ["#ff6b6b", "#ff9f43", "#feca57", "#1dd1a1", "#54a0ff", "#5f27cd", "#ee5253"]
-    h = canvas.winfo_height() or APP_H
-    w = canvas.winfo_width() or APP_W
-    stripe_h = max(1, h // len(colors))
-    canvas.delete("all")
-    for i, color in enumerate(colors):
-        y0 = i * stripe_h
-        y1 = (i + 1) * stripe_h if i < len(colors) - 1 else h
-        canvas.create_rectangle(0, y0, w, y1, fill=color, width=0)
-    canvas.create_rectangle(0, 0, w, h, fill="#000000", width=0, stipple="gray25")
-    for (x, y, r) in [(80, 90, 60), (760, 140, 48), (460, 360, 90), (150, 500, 40)]:
-        canvas.create_oval(x - r, y - r, x + r, y + r, outline="", fill="#ffffff")
+GRADIENT_COLORS = ["#ff6b6b", "#ff9f43", "#feca57", "#1dd1a1", "#54a0ff", "#5f27cd", "#ee5253"]
+GRADIENT_SHADE = 0.75  # pengganti overlay stipple gray25 (25% piksel hitam)
+GRADIENT_CACHE_SIZE = 2  # jumlah PhotoImage gradasi halus yang disimpan (per ukuran)
+GRADIENT_BUBBLES = [(80, 90, 60), (760, 140, 48), (460, 360, 90), (150, 500, 40)]
+SPRITE_CACHE_SIZE = 3  # jumlah ukuran kotak yang sprite papan/token-nya disimpan
+CELL_PALETTE = ["#2a9d8f", "#e76f51", "#264653", "#f4a261", "#1d3557", "#a8dadc", "#e63946", "#457b9d"]
+# Font piksel 5x7 untuk nomor kotak: digambar sekali ke gambar papan, bukan 100 item teks
+DIGIT_GLYPHS = {
+    "0": [".###.", "#...#", "#..##", "#.#.#", "##..#", "#...#", ".###."],
+    "1": ["..#..", ".##..", "..#..", "..#..", "..#..", "..#..", ".###."],
+    "2": [".###.", "#...#", "....#", "...#.", "..#..", ".#...", "#####"],
+    "3": ["#####", "...#.", "..#..", "...#.", "....#", "#...#", ".###."],
+    "4": ["...#.", "..##.", ".#.#.", "#..#.", "#####", "...#.", "...#."],
+    "5": ["#####", "#....", "####.", "....#", "....#", "#...#", ".###."],
+    "6": ["..##.", ".#...", "#....", "####.", "#...#", "#...#", ".###."],
+    "7": ["#####", "....#", "...#.", "..#..", ".#...", ".#...", ".#..."],
+    "8": [".###.", "#...#", "#...#", ".###.", "#...#", "#...#", ".###."],
+    "9": [".###.", "#...#", "#...#", ".####", "....#", "...#.", ".##.."],
+}
+
+def hex_to_rgb(color):
+    return int(color[1:3], 16), int(color[3:5], 16), int(color[5:7], 16)
+
+def shade(color, factor):
+    r, g, b = hex_to_rgb(color)
+    return f"#{int(r * factor):02x}{int(g * factor):02x}{int(b * factor):02x}"
+
+def gradient_column(colors, h, factor=1.0):
+    # Satu warna per baris piksel, interpolasi linear antar warna
+    rgbs = [hex_to_rgb(c) for c in colors]
+    segs = len(rgbs) - 1
+    col = []
+    for y in range(h):
+        t = y * segs / max(1, h - 1)
+        i = min(int(t), segs - 1)
+        f = t - i
+        (r0, g0, b0), (r1, g1, b1) = rgbs[i], rgbs[i + 1]
+        col.append("#%02x%02x%02x" % (int((r0 + (r1 - r0) * f) * factor),
+                                      int((g0 + (g1 - g0) * f) * factor),
+                                      int((b0 + (b1 - b0) * f) * factor)))
+    return col
+
+# Background gradasi untuk canvas root: item canvas dibuat sekali dan hanya dipindah
+# saat ukuran berubah, burst event <Configure> di-debounce dengan after().
+# Mode smooth memakai satu PhotoImage yang di-cache per (lebar, tinggi).
+class GradientBackground:
+    def __init__(self, canvas, smooth=False, debounce_ms=RESIZE_DEBOUNCE_MS):
+        self.canvas = canvas
+        self.smooth = smooth
+        self.debounce_ms = debounce_ms
+        self.size = None
+        self.job = None
+        self.pending_size = None
+        self.stripes = []
+        self.image_item = None
+        self.images = OrderedDict()  # (w, h) -> PhotoImage
+        self.canvas.bind("<Configure>", self.on_configure)
+
+    def on_configure(self, event):
+        self.pending_size = (event.width, event.height)
+        if self.job is not None:
+            self.canvas.after_cancel(self.job)
+        self.job = self.canvas.after(self.debounce_ms, self.flush)
+
+    def flush(self):
+        self.job = None
+        if self.pending_size:
+            self.paint(*self.pending_size)
+
+    @profiled("paint_gradient")
+    def paint(self, w=None, h=None):
+        w = w or self.canvas.winfo_width() or APP_W
+        h = h or self.canvas.winfo_height() or APP_H
+        if (w, h) == self.size:
+            return
+        if not self.stripes and self.image_item is None:
+            self._build()
+        if self.smooth:
+            self.canvas.itemconfig(self.image_item, image=self._image_for(w, h))
+        else:
+            stripe_h = max(1, h // len(GRADIENT_COLORS))
+            for i, item in enumerate(self.stripes):
+                y0 = i * stripe_h
+                y1 = (i + 1) * stripe_h if i < len(self.stripes) - 1 else h
+                self.canvas.coords(item, 0, y0, w, y1)
+        self.size = (w, h)
+
+    def _build(self):
+        if self.smooth:
+            self.image_item = self.canvas.create_image(0, 0, anchor="nw")
+        else:
+            for color in GRADIENT_COLORS:
+                self.stripes.append(self.canvas.create_rectangle(0, 0, 0, 0, width=0,
+                                                                 fill=shade(color, GRADIENT_SHADE)))
+        for (x, y, r) in GRADIENT_BUBBLES:
+            self.canvas.create_oval(x - r, y - r, x + r, y + r, outline="", fill="#ffffff")
+
+    def _image_for(self, w, h):
+        key = (w, h)
+        if key in self.images:
+            self.images.move_to_end(key)
+            return self.images[key]
+        img = tk.PhotoImage(master=self.canvas, width=w, height=h)
+        # Satu kolom 1 piksel, di-tile ke seluruh lebar dalam satu panggilan put
+        column = gradient_column(GRADIENT_COLORS, h, GRADIENT_SHADE)
+        img.put(" ".join("{%s}" % c for c in column), to=(0, 0, w, h))
+        self.images[key] = img
+        while len(self.images) > GRADIENT_CACHE_SIZE:
+            self.images.popitem(last=False)
+        return img
+
+# Sprite dibangun dari daftar persegi (warna, x0, y0, x1, y1); tiap persegi satu put()
+# berwarna tunggal, jadi biayanya sebanding jumlah persegi, bukan jumlah piksel.
+def glyph_runs(text, scale):
+    # Rentang piksel teks relatif pojok kiri atas -> (runs, lebar, tinggi)
+    runs = []
+    for k, ch in enumerate(text):
+        ox = k * 6 * scale
+        for gy, row in enumerate(DIGIT_GLYPHS[ch]):
+            x = 0
+            while x < 5:
+                if row[x] != "#":
+                    x += 1
+                    continue
+                x0 = x
+                while x < 5 and row[x] == "#":
+                    x += 1
+                runs.append((ox + x0 * scale, gy * scale, ox + x * scale, (gy + 1) * scale))
+    return runs, (len(text) * 6 - 1) * scale, 7 * scale
+
+def serpentine_cell(idx, board_size):
+    # Kolom/baris grid kotak idx: baris bawah kiri->kanan, baris berikutnya berbalik arah
+    row, col = divmod(idx - 1, board_size)
+    x = col if row % 2 == 0 else board_size - 1 - col
+    return x, board_size - 1 - row
+
+def board_rects(board_size, cell_px, cell_of):
+    # Papan statis (kotak berwarna, garis tepi putih, nomor) untuk satu ukuran kotak
+    c = cell_px
+    side = c * board_size
+    scale = max(1, c // 22)
+    # Nomor hanya digambar jika nomor terbesar muat di dalam kotak (papan besar, kotak kecil)
+    labels = (len(str(board_size**2)) * 6 - 1) * scale <= c - 2
+    rects = []
+    for i in range(1, board_size**2 + 1):
+        gx, gy = cell_of(i)
+        x, y = gx * c, gy * c
+        rects.append((CELL_PALETTE[i % len(CELL_PALETTE)], x, y, x + c, y + c))
+        if not labels:
+            continue
+        runs, tw, th = glyph_runs(str(i), scale)
+        ox, oy = x + (c - tw) // 2, y + (c - th) // 2
+        rects.extend(("#ffffff", ox + x0, oy + y0, ox + x1, oy + y1) for x0, y0, x1, y1 in runs)
+    for k in range(board_size + 1):
+        pos = min(k * c, side - 1)
+        rects.append(("#ffffff", pos, 0, pos + 1, side))
+        rects.append(("#ffffff", 0, pos, side, pos + 1))
+    return rects
+
+def disc_rects(r, color, inner=0):
+    # Lingkaran berdiameter 2r, atau cincin jika inner > 0; piksel lain tetap transparan
+    rects = []
+    for y in range(2 * r):
+        dy = y - r + 0.5
+        half = math.sqrt(max(0.0, r * r - dy * dy))
+        x0, x1 = int(round(r - half)), int(round(r + half))
+        if abs(dy) < inner:
+            ih = math.sqrt(inner * inner - dy * dy)
+            rects.append((color, x0, y, int(round(r - ih)), y + 1))
+            rects.append((color, int(round(r + ih)), y, x1, y + 1))
+        elif x1 > x0:
+            rects.append((color, x0, y, x1, y + 1))
+    return rects
+
+def render_rects(master, w, h, rects):
+    img = tk.PhotoImage(master=master, width=w, height=h)
+    for color, x0, y0, x1, y1 in rects:
+        if x1 > x0 and y1 > y0:
+            img.put(color, to=(x0, y0, x1, y1))
+    return img
+
+class SpriteAtlas:
+    # build(cell_px) -> {nama: (lebar, tinggi, rects)}; hasil render di-cache per ukuran kotak (LRU)
+    def __init__(self, widget, build, max_sizes=SPRITE_CACHE_SIZE):
+        self.widget = widget
+        self.build = build
+        self.max_sizes = max_sizes
+        self.sizes = OrderedDict()
+
+    def get(self, cell_px):
+        if cell_px in self.sizes:
+            self.sizes.move_to_end(cell_px)
+            return self.sizes[cell_px]
+        with PROFILER.measure("build_sprites"):
+            sprites = {name: render_rects(self.widget, w, h, rects)
+                       for name, (w, h, rects) in self.build(cell_px).items()}
+        self.sizes[cell_px] = sprites
+        while len(self.sizes) > self.max_sizes:
+            self.sizes.popitem(last=False)
+        return sprites
+
+def lerp_points(a, b, steps):
+    # steps titik dari a (tidak termasuk) sampai b (termasuk)
+    return [(a[0] + (b[0] - a[0]) * i / steps, a[1] + (b[1] - a[1]) * i / steps)
+            for i in range(1, steps + 1)]
+
+# Satu loop after() untuk semua animasi sebuah widget. Frame dipilih dari waktu yang
+# sudah berlalu, jadi saat event loop lambat frame dilewati (bukan tertinggal).
+# Animasi dengan key yang sama digabung: yang lama langsung diselesaikan.
+class AnimationScheduler:
+    def __init__(self, widget, fps=ANIM_FPS):
+        self.widget = widget
+        self.fps = fps
+        self.frame_ms = max(1, 1000 // fps)
+        self.anims = {}  # key -> [frames, apply, on_done, t0, frame terakhir]
+        self.timers = {}  # key -> after id
+        self.job = None
+        self.dropped = 0
+
+    def active(self, key):
+        return key in self.anims
+
+    def play(self, key, frames, apply, on_done=None):
+        if key in self.anims:
+            self.finish(key)
+        if not frames:
+            if on_done:
+                on_done()
+            return
+        self.anims[key] = [frames, apply, on_done, time.perf_counter(), 0]
+        apply(frames[0])
+        if self.job is None:
+            self.job = self.widget.after(self.frame_ms, self._tick)
+
+    def finish(self, key):
+        frames, apply, on_done, _, _ = self.anims.pop(key)
+        apply(frames[-1])
+        if on_done:
+            on_done()
+
+    def later(self, key, delay_ms, fn):
+        # Timer sekali jalan yang bisa dibatalkan/ditimpa lewat key
+        self.cancel(key)
+
+        def run():
+            self.timers.pop(key, None)
+            fn()
+        self.timers[key] = self.widget.after(delay_ms, run)
+
+    def cancel(self, key):
+        self.anims.pop(key, None)
+        job = self.timers.pop(key, None)
+        if job is not None:
+            try:
+                self.widget.after_cancel(job)
+            except Exception:
+                pass
+
+    def cancel_all(self):
+        for key in list(self.timers):
+            self.cancel(key)
+        self.anims.clear()
+        if self.job is not None:
+            try:
+                self.widget.after_cancel(self.job)
+            except Exception:
+                pass
+            self.job = None
+
+    def _tick(self):
+        self.job = None
+        now = time.perf_counter()
+        for key, anim in list(self.anims.items()):
+            if self.anims.get(key) is not anim:
+                continue
+            frames, apply, on_done, t0, last = anim
+            idx = int((now - t0) * self.fps)
+            if idx >= len(frames) - 1:
+                self.dropped += max(0, len(frames) - 2 - last)
+                self.finish(key)
+            elif idx > last:
+                self.dropped += idx - last - 1
+                anim[4] = idx
+                apply(frames[idx])
+        if self.anims and self.job is None:
+            self.job = self.widget.after(self.frame_ms, self._tick)
+
+# Toast: Label yang di-place di atas jendela (seperti overlay profiling), jadi event loop
+# tidak pernah diblok. Label dipakai ulang dari pool; teks yang sama tidak ditumpuk.
+TOAST_COLORS = {"info": ("#ffdd77", "#1b1b1b"), "win": ("#1dd1a1", "#0b2e22"),
+                "error": ("#ff6b6b", "#ffffff")}
+
+class ToastManager:
+    def __init__(self, root, max_visible=TOAST_MAX_VISIBLE, duration_ms=TOAST_MS, max_queue=TOAST_QUEUE_MAX):
+        self.root = root
+        self.max_visible = max_visible
+        self.duration_ms = duration_ms
+        self.pending = deque(maxlen=max_queue)  # (teks, jenis, durasi)
+        self.visible = []  # [label, teks, after id], paling bawah dulu
+        self.pool = []
+        self.dropped = 0
+
+    def show(self, text, kind="info", duration_ms=None):
+        duration_ms = duration_ms or self.duration_ms
+        for toast in self.visible:
+            if toast[1] == text:
+                self._arm(toast, duration_ms)  # sudah tampil: cukup perpanjang
+                return
+        if any(item[0] == text for item in self.pending):
+            return
+        if len(self.pending) == self.pending.maxlen:
+            self.dropped += 1
+        self.pending.append((text, kind, duration_ms))
+        self._pump()
+
+    def _pump(self):
+        while self.pending and len(self.visible) < self.max_visible:
+            text, kind, duration_ms = self.pending.popleft()
+            label = self.pool.pop() if self.pool else self._new_label()
+            bg, fg = TOAST_COLORS.get(kind, TOAST_COLORS["info"])
+            label.config(text=text, bg=bg, fg=fg)
+            toast = [label, text, None]
+            self.visible.append(toast)
+            self._arm(toast, duration_ms)
+        self._layout()
+
+    def _new_label(self):
+        label = tk.Label(self.root, font=("Helvetica", 12, "bold"), padx=14, pady=8, bd=0)
+        label.bind("<Button-1>", lambda e: self.dismiss(label))  # klik untuk menutup
+        return label
+
+    def _arm(self, toast, duration_ms):
+        if toast[2] is not None:
+            self.root.after_cancel(toast[2])
+        toast[2] = self.root.after(duration_ms, self.dismiss, toast[0])
+
+    def _layout(self):
+        for i, (label, _, _) in enumerate(self.visible):
+            label.place(relx=0.5, rely=1.0, anchor="s", y=-(16 + i * TOAST_SPACING_PX))
+            label.lift()
+
+    def dismiss(self, label):
+        for toast in self.visible:
+            if toast[0] is label:
+                break
+        else:
+            return
+        self.visible.remove(toast)
+        if toast[2] is not None:
+            self.root.after_cancel(toast[2])
+        label.place_forget()
+        self.pool.append(label)
+        self._pump()
+
+    def clear(self):
+        self.pending.clear()
+        for toast in list(self.visible):
+            self.dismiss(toast[0])
+
+def toast(widget, text, kind="info", duration_ms=None):
+    # Satu ToastManager per jendela, dibuat saat toast pertama
+    top = widget.winfo_toplevel()
+    manager = getattr(top, "toasts", None)
+    if manager is None:
+        manager = top.toasts = ToastManager(top)
+    manager.show(text, kind, duration_ms)
+    return manager
 
 def fancy_label(parent, text, font=("Helvetica", 22, "bold"), fg="#ffffff", bg="#000000"):
     return tk.Label(parent, text=text, font=font, fg=fg, bg=bg, padx=10, pady=6)
@@ -38,13 +563,1834 @@ def fancy_button(parent, text, cmd, bg="#34495e", fg="#ffffff"):
                      fg=fg, bg=bg, activebackground="#2c3e50", activeforeground="#ecf0f1",
                      padx=16, pady=10, bd=0)
 
+# ---------------------------
+# Game engines (tanpa Tk, bisa dijalankan headless)
+# ---------------------------
+
+DEFAULT_LADDERS = {3: 22, 5: 8, 11: 26, 20: 29, 27: 56, 36: 44}
+DEFAULT_SNAKES = {32: 10, 48: 26, 62: 18, 88: 24, 95: 56, 97: 78}
+
+def jump_table(ladders, snakes, board_size=10):
+    # table[i] = kotak akhir setelah mendarat di i (indeks 0 tidak dipakai)
+    goal = board_size**2
+    table = list(range(goal + 1))
+    for s, e in ladders.items():
+        table[s] = e
+    for s, e in snakes.items():
+        table[s] = e
+    return table
+
+# Hasil satu lemparan: landed = kotak sebelum naik tangga / turun ular
+SnakesMove = namedtuple("SnakesMove", "player dice start landed end winner")
+
+class SnakesEngine:
+    def __init__(self, players=("Merah", "Biru"), ladders=None, snakes=None, board_size=10, rng=None):
+        self.players = list(players)
+        self.ladders = dict(DEFAULT_LADDERS if ladders is None else ladders)
+        self.snakes = dict(DEFAULT_SNAKES if snakes is None else snakes)
+        self.board_size = board_size
+        self.goal = board_size**2
+        # Array datar kotak -> kotak akhir: satu indeks per lemparan, bukan dua lookup dict
+        self.jumps = jump_table(self.ladders, self.snakes, board_size)
+        self.rng = rng or random
+        self.reset()
+
+    def reset(self):
+        self.positions = {p: 1 for p in self.players}
+        self.turn_idx = 0
+        self.turns = 0
+        self.winner = None
+
+    @property
+    def game_over(self):
+        return self.winner is not None
+
+    @property
+    def current_player(self):
+        return self.players[self.turn_idx]
+
+    def roll(self, dice=None):
+        if self.game_over:
+            return None
+        player = self.players[self.turn_idx]
+        d = dice if dice is not None else self.rng.randint(1, 6)
+        start = self.positions[player]
+        landed = start + d
+        if landed > self.goal:
+            landed = start  # harus tepat di kotak terakhir
+        new_pos = self.jumps[landed]
+        self.positions[player] = new_pos
+        self.turns += 1
+        if new_pos == self.goal:
+            self.winner = player
+        else:
+            self.turn_idx = (self.turn_idx + 1) % len(self.players)
+        return SnakesMove(player, d, start, landed, new_pos, self.winner)
+
+SNAKES_PLAYERS = ["Merah", "Biru", "Hijau", "Kuning", "Ungu", "Oranye", "Putih", "Cokelat"]
+SNAKES_COLORS = ["#e74c3c", "#3498db", "#2ecc71", "#f1c40f", "#9b59b6", "#e67e22", "#ecf0f1", "#8d6e63"]
+SNAKES_MAX_SIZE = 30
+BOARDS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "boards")
+
+# Definisi papan dari file JSON: {"name", "size", "ladders": {"3": 22}, "snakes": {...},
+# "players": 4 atau [{"name": "Merah", "color": "#e74c3c"}, ...]}. players dan colors sejajar.
+SnakesBoard = namedtuple("SnakesBoard", "name size ladders snakes players colors")
+
+DEFAULT_BOARD = SnakesBoard("Klasik 10x10", 10, DEFAULT_LADDERS, DEFAULT_SNAKES,
+                            SNAKES_PLAYERS[:2], SNAKES_COLORS[:2])
+
+def validate_jumps(size, ladders, snakes):
+    goal = size**2
+    starts = set()
+    for kind, jumps, up in (("tangga", ladders, True), ("ular", snakes, False)):
+        for s, e in jumps.items():
+            if not (1 < s < goal and 1 <= e <= goal):
+                raise ValueError(f"{kind} {s}->{e} di luar papan 2..{goal - 1}")
+            if (e > s) != up:
+                raise ValueError(f"{kind} {s}->{e} harus " + ("naik" if up else "turun"))
+            if s in starts:
+                raise ValueError(f"kotak {s} punya lebih dari satu tangga/ular")
+            starts.add(s)
+    # Tidak boleh berakhir di awal tangga/ular lain; dengan begitu siklus juga tidak mungkin
+    for s, e in list(ladders.items()) + list(snakes.items()):
+        if e in starts:
+            raise ValueError(f"{s}->{e} berakhir di awal tangga/ular lain")
+
+def _board_int(value, what):
+    # JSON true/false adalah int di Python dan int(10.7) diam-diam jadi 10: tolak keduanya
+    if isinstance(value, bool) or not isinstance(value, int):
+        raise ValueError(f"{what} harus bilangan bulat, bukan {value!r}")
+    return value
+
+def board_from_dict(data, name=None):
+    try:
+        size = _board_int(data.get("size", 10), "size")
+        ladders = {int(s): _board_int(e, f"tangga {s}") for s, e in data.get("ladders", {}).items()}
+        snakes = {int(s): _board_int(e, f"ular {s}") for s, e in data.get("snakes", {}).items()}
+        players = data.get("players", 2)
+        if not isinstance(players, list):
+            players = _board_int(players, "players")
+            if not 1 <= players <= len(SNAKES_PLAYERS):
+                raise ValueError(f"jumlah pemain harus 1..{len(SNAKES_PLAYERS)}")
+            players = [{"name": n, "color": c} for n, c in zip(SNAKES_PLAYERS[:players], SNAKES_COLORS)]
+        names = [str(p["name"]) for p in players]
+        colors = [str(p["color"]) for p in players]
+        for color in colors:
+            if len(color) != 7 or color[0] != "#":
+                raise ValueError(f"warna {color!r} harus berbentuk #rrggbb")
+            hex_to_rgb(color)
+    except (AttributeError, KeyError, TypeError, ValueError) as e:
+        raise ValueError(f"format papan tidak valid: {e}") from None
+    if not 2 <= size <= SNAKES_MAX_SIZE:
+        raise ValueError(f"ukuran papan harus 2..{SNAKES_MAX_SIZE}")
+    if not 1 <= len(names) <= len(SNAKES_PLAYERS) or len(set(names)) != len(names):
+        raise ValueError(f"pemain harus 1..{len(SNAKES_PLAYERS)} dengan nama berbeda")
+    validate_jumps(size, ladders, snakes)
+    return SnakesBoard(str(data.get("name", name or f"{size}x{size}")), size, ladders, snakes, names, colors)
+
+def board_to_dict(board):
+    return {"name": board.name, "size": board.size,
+            "ladders": {str(s): e for s, e in board.ladders.items()},
+            "snakes": {str(s): e for s, e in board.snakes.items()},
+            "players": [{"name": n, "color": c} for n, c in zip(board.players, board.colors)]}
+
+def load_board(path):
+    with open(path, encoding="utf-8") as f:
+        return board_from_dict(json.load(f), os.path.splitext(os.path.basename(path))[0])
+
+def load_boards(directory=BOARDS_DIR):
+    # Papan bawaan + semua *.json di folder boards/; file yang tidak valid dilewati
+    boards = [DEFAULT_BOARD]
+    if not os.path.isdir(directory):
+        return boards
+    for name in sorted(os.listdir(directory)):
+        if not name.endswith(".json"):
+            continue
+        try:
+            boards.append(load_board(os.path.join(directory, name)))
+        except (OSError, ValueError) as e:
+            print(f"Papan {name} dilewati: {e}", file=sys.stderr)
+    return boards
+
+TTT_LINES = [
+    (0, 1, 2), (3, 4, 5), (6, 7, 8),
+    (0, 3, 6), (1, 4, 7), (2, 5, 8),
+    (0, 4, 8), (2, 4, 6)
+]
+
+# (ukuran papan, panjang deret untuk menang); 15x15 lima sejajar = Gomoku
+TTT_VARIANTS = [(3, 3), (5, 4), (10, 5), (15, 5)]
+TTT_DIRECTIONS = [(0, 1), (1, 0), (1, 1), (1, -1)]
+
+class TicTacToeEngine:
+    def __init__(self, size=3, win_len=3):
+        self.size = size
+        self.win_len = win_len
+        self.cells = size * size
+        self.reset()
+
+    def reset(self):
+        self.board = [""] * self.cells
+        # Bitboard per pemain: bit idx = kotak (r * size + c)
+        self.bits = {"X": 0, "O": 0}
+        self.filled = 0
+        self.current_player = "X"
+        self.winner = None
+        self.winning_line = None
+        self.draw = False
+
+    @property
+    def game_over(self):
+        return self.winner is not None or self.draw
+
+    def legal_moves(self):
+        return [i for i, v in enumerate(self.board) if v == ""]
+
+    def play(self, idx):
+        # True jika langkah diterima
+        if self.game_over or self.board[idx] != "":
+            return False
+        self.board[idx] = self.current_player
+        self.bits[self.current_player] |= 1 << idx
+        self.filled += 1
+        self.winner = self.check_winner(idx)
+        if not self.winner:
+            if self.filled == self.cells:
+                self.draw = True
+            else:
+                self.current_player = "O" if self.current_player == "X" else "X"
+        return True
+
+    def check_winner(self, idx):
+        # Hanya 4 garis yang melewati kotak terakhir, jadi biaya per langkah tidak
+        # bergantung pada ukuran papan
+        player = self.board[idx]
+        if not player:
+            return None
+        bits = self.bits[player]
+        n = self.size
+        r0, c0 = divmod(idx, n)
+        for dr, dc in TTT_DIRECTIONS:
+            line = [idx]
+            for sign in (1, -1):
+                r, c = r0 + dr * sign, c0 + dc * sign
+                while 0 <= r < n and 0 <= c < n and bits >> (r * n + c) & 1:
+                    line.append(r * n + c)
+                    r, c = r + dr * sign, c + dc * sign
+            if len(line) >= self.win_len:
+                self.winning_line = tuple(sorted(line))
+                return player
+        self.winning_line = None
+        return None
+
+QUIZ_OPS = ["+", "-", "×", "÷"]
+# Rentang operand per tier (mudah, sedang, sulit). Untuk ÷: (pembagi, hasil bagi).
+# Tier 1 sama dengan rentang lama (2-20, pembagian dari 2-10).
+QUIZ_TIERS = {
+    "+": [((1, 10), (1, 10)), ((2, 20), (2, 20)), ((10, 99), (10, 99))],
+    "-": [((1, 10), (1, 10)), ((2, 20), (2, 20)), ((10, 99), (10, 99))],
+    "×": [((1, 5), (2, 10)), ((2, 20), (2, 20)), ((6, 25), (6, 25))],
+    "÷": [((2, 5), (1, 10)), ((2, 10), (2, 10)), ((3, 15), (6, 20))],
+}
+QUIZ_START_TIER = 1
+QUIZ_BANK_PER_OP = 500  # maksimum soal unik per operator per tier
+QUIZ_WINDOW = 6  # jumlah jawaban terakhir untuk memilih tier
+QUIZ_FAST_S = 6.0
+QUIZ_SLOW_S = 15.0
+QUIZ_MAX_ANSWER = 10**6  # jawaban di luar ini ditolak sebelum masuk engine/log/database
+
+def quiz_item(op, x, y):
+    # (a, b, jawaban) dari pasangan operand mentah
+    if op == "÷":
+        return x * y, x, y
+    if op == "×":
+        return x, y, x * y
+    if op == "+":
+        return x, y, x + y
+    a, b = max(x, y), min(x, y)
+    return a, b, a - b
+
+# Bank soal: dibangun sekali, tiap (tier, operator) disimpan sebagai array('i') berisi
+# [a, b, jawaban] berurutan, lalu diambil dari urutan acak tanpa pengembalian.
+# Operator dipilih merata (25% masing-masing) seperti sebelum ada bank soal,
+# tidak sebanding dengan jumlah soal unik per operator.
+class QuestionBank:
+    def __init__(self, rng=None, per_op=QUIZ_BANK_PER_OP):
+        self.rng = rng or random
+        self.tiers = []  # tier -> [array per operator]
+        self.orders = []
+        self.cursors = []
+        for tier in range(len(QUIZ_TIERS["+"])):
+            packs, orders = [], []
+            for op in QUIZ_OPS:
+                packed = array("i")
+                for item in self._unique(op, QUIZ_TIERS[op][tier], per_op):
+                    packed.extend(item)
+                order = array("I", range(len(packed) // 3))
+                self.rng.shuffle(order)
+                packs.append(packed)
+                orders.append(order)
+            self.tiers.append(packs)
+            self.orders.append(orders)
+            self.cursors.append([0] * len(QUIZ_OPS))
+
+    def _unique(self, op, ranges, n):
+        (x_lo, x_hi), (y_lo, y_hi) = ranges
+        space = (x_hi - x_lo + 1) * (y_hi - y_lo + 1)
+        if space <= n * 2:
+            items = sorted({quiz_item(op, x, y) for x in range(x_lo, x_hi + 1)
+                            for y in range(y_lo, y_hi + 1)})
+            return self.rng.sample(items, min(n, len(items)))
+        seen = set()
+        while len(seen) < n:
+            seen.add(quiz_item(op, self.rng.randint(x_lo, x_hi), self.rng.randint(y_lo, y_hi)))
+        return sorted(seen)
+
+    def __len__(self):
+        return sum(len(order) for orders in self.orders for order in orders)
+
+    def next(self, tier):
+        # Operator acak merata, lalu soal berikutnya untuk operator itu; habis = diacak ulang
+        op_idx = self.rng.randrange(len(QUIZ_OPS))
+        order = self.orders[tier][op_idx]
+        cursors = self.cursors[tier]
+        if cursors[op_idx] == len(order):
+            self.rng.shuffle(order)
+            cursors[op_idx] = 0
+        i = order[cursors[op_idx]] * 3
+        cursors[op_idx] += 1
+        a, b, ans = self.tiers[tier][op_idx][i:i + 3]
+        return a, QUIZ_OPS[op_idx], b, ans
+
+# Pilih tier dari akurasi & waktu jawab rata-rata di jendela bergulir (jumlah dijaga
+# bertahap sehingga tiap update O(1))
+class AdaptiveSelector:
+    def __init__(self, tiers, start=QUIZ_START_TIER, window=QUIZ_WINDOW):
+        self.tiers = tiers
+        self.start = start
+        self.window = window
+        self.reset()
+
+    def reset(self):
+        self.tier = self.start
+        self.recent = deque()
+        self.correct_sum = 0
+        self.time_sum = 0.0
+
+    def record(self, correct, seconds):
+        self.recent.append((correct, seconds))
+        self.correct_sum += correct
+        self.time_sum += seconds
+        if len(self.recent) > self.window:
+            old_correct, old_seconds = self.recent.popleft()
+            self.correct_sum -= old_correct
+            self.time_sum -= old_seconds
+        if len(self.recent) < self.window:
+            return self.tier
+        accuracy = self.correct_sum / self.window
+        mean_s = self.time_sum / self.window
+        if accuracy >= 0.8 and mean_s <= QUIZ_FAST_S and self.tier < self.tiers - 1:
+            self._move(1)
+        elif (accuracy < 0.5 or mean_s > QUIZ_SLOW_S) and self.tier > 0:
+            self._move(-1)
+        return self.tier
+
+    def _move(self, step):
+        # Jendela dikosongkan agar tier baru dinilai dari jawaban di tier itu sendiri
+        self.tier += step
+        self.recent.clear()
+        self.correct_sum = 0
+        self.time_sum = 0.0
+
+class QuizEngine:
+    def __init__(self, rng=None, bank=None, clock=time.monotonic):
+        self.rng = rng or random
+        self.bank = bank or QuestionBank(self.rng)
+        self.selector = AdaptiveSelector(len(self.bank.tiers))
+        self.clock = clock
+        self.question = None
+        self.current_answer = None
+        self.asked_at = None
+        self.last_response_s = None
+        self.reset()
+
+    def reset(self):
+        self.score = 0
+        self.total = 0
+        self.selector.reset()
+
+    @property
+    def tier(self):
+        return self.selector.tier
+
+    def new_question(self):
+        a, op, b, self.current_answer = self.bank.next(self.selector.tier)
+        self.question = (a, op, b)
+        self.asked_at = self.clock()
+        return f"{a} {op} {b} = ?"
+
+    def submit(self, answer):
+        self.total += 1
+        correct = answer == self.current_answer
+        if correct:
+            self.score += 1
+        # Dibulatkan ke milidetik agar replay (yang menyimpan ms) memberi tier yang sama persis
+        self.last_response_s = round(self.clock() - self.asked_at, 3) if self.asked_at is not None else 0.0
+        self.selector.record(correct, self.last_response_s)
+        return correct
+
+# ---------------------------
+# Headless batch API (untuk balancing & regression, tanpa X display)
+# ---------------------------
+
+def simulate_snakes(games, players=2, ladders=None, snakes=None, seed=None):
+    import statistics
+    rng = random.Random(seed)
+    engine = SnakesEngine([f"P{i + 1}" for i in range(players)], ladders, snakes, rng=rng)
+    wins = {p: 0 for p in engine.players}
+    turns = []
+    t0 = time.perf_counter()
+    for _ in range(games):
+        engine.reset()
+        while not engine.game_over:
+            engine.roll()
+        wins[engine.winner] += 1
+        turns.append(engine.turns)
+    elapsed = time.perf_counter() - t0
+    return {
+        "game": "snakes", "games": games, "wins": wins,
+        "mean_turns": statistics.fmean(turns) if turns else 0.0,
+        "max_turns": max(turns, default=0),
+        "elapsed_s": elapsed, "games_per_s": games / elapsed if elapsed else 0.0,
+    }
+
+def simulate_ttt(games, seed=None, size=3, win_len=3):
+    # Dua pemain acak; berguna untuk regression aturan menang/seri
+    rng = random.Random(seed)
+    engine = TicTacToeEngine(size, win_len)
+    results = {"X": 0, "O": 0, "draw": 0}
+    t0 = time.perf_counter()
+    for _ in range(games):
+        engine.reset()
+        while not engine.game_over:
+            engine.play(rng.choice(engine.legal_moves()))
+        results[engine.winner or "draw"] += 1
+    elapsed = time.perf_counter() - t0
+    return {"game": "ttt", "games": games, "results": results,
+            "elapsed_s": elapsed, "games_per_s": games / elapsed if elapsed else 0.0}
+
+def simulate_quiz(questions, accuracy=0.8, seed=None):
+    rng = random.Random(seed)
+    engine = QuizEngine(rng)
+    ops = {op: 0 for op in QUIZ_OPS}
+    t0 = time.perf_counter()
+    for _ in range(questions):
+        engine.new_question()
+        ops[engine.question[1]] += 1
+        answer = engine.current_answer if rng.random() < accuracy else engine.current_answer + 1
+        engine.submit(answer)
+    elapsed = time.perf_counter() - t0
+    return {"game": "quiz", "questions": questions, "score": engine.score, "ops": ops,
+            "final_tier": engine.tier,
+            "elapsed_s": elapsed, "per_s": questions / elapsed if elapsed else 0.0}
+
+SIMULATORS = {"snakes": simulate_snakes, "ttt": simulate_ttt, "quiz": simulate_quiz}
+
+# ---------------------------
+# Replay: log event biner per sesi + pemutar ulang
+# ---------------------------
+
+REPLAY_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "replays")
+REPLAY_MAGIC = b"MGR1"
+# header: magic, kode game, seed, param1, param2, waktu mulai
+# (snakes: param1 = jumlah pemain; ttt: param1 = ukuran, param2 = panjang deret)
+REPLAY_HEADER = struct.Struct("<4sBQBBd")
+# event: jenis, nilai, ms (jeda sejak event sebelumnya; untuk jawaban = waktu jawab)
+REPLAY_EVENT = struct.Struct("<BiI")
+REPLAY_GAMES = {"snakes": 1, "ttt": 2, "quiz": 3}
+REPLAY_KEEP = 1000  # file .mgr terbaru yang disimpan; yang lebih lama dihapus saat log baru dibuka
+EV_ROLL, EV_CLICK, EV_ANSWER, EV_SKIP = 1, 2, 3, 4
+# snakes dengan param2 = 1: setelah header ada definisi papan (uint32 panjang + JSON)
+REPLAY_BOARD_LEN = struct.Struct("<I")
+
+ReplayHeader = namedtuple("ReplayHeader", "game seed param1 param2 started board")
+
+def new_seed():
+    return random.SystemRandom().getrandbits(64)
+
+class ReplayLog:
+    def __init__(self, game, seed, param1=0, param2=0, directory=REPLAY_DIR, board=None):
+        self.game = game
+        self.seed = seed
+        if board is not None:
+            param2 = 1
+        self.header = REPLAY_HEADER.pack(REPLAY_MAGIC, REPLAY_GAMES[game], seed, param1, param2, time.time())
+        if board is not None:
+            blob = json.dumps(board, separators=(",", ":")).encode()
+            self.header += REPLAY_BOARD_LEN.pack(len(blob)) + blob
+        self.directory = directory
+        self.path = None
+        self.file = None  # dibuka saat event pertama; False jika gagal
+        self.last = time.monotonic()
+
+    def append(self, kind, value, ms=None):
+        now = time.monotonic()
+        if ms is None:
+            ms = int((now - self.last) * 1000)
+        self.last = now
+        if self.file is None:
+            self._open()
+        if self.file:
+            self.file.write(REPLAY_EVENT.pack(kind, value, min(ms, 0xFFFFFFFF)))
+
+    def _open(self):
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            prune_replays(self.directory, REPLAY_KEEP - 1)
+            self.path = os.path.join(self.directory,
+                                     time.strftime(f"{self.game}-%Y%m%d-%H%M%S-{self.seed:016x}.mgr"))
+            # Tanpa buffer: tiap event langsung ke file, jadi log tetap ada kalau proses mati
+            self.file = open(self.path, "wb", buffering=0)
+            self.file.write(self.header)
+        except OSError:
+            self.file = False
+
+    def close(self):
+        if self.file:
+            self.file.close()
+        self.file = False
+
+def prune_replays(directory, keep=REPLAY_KEEP):
+    # Hapus file replay tertua sampai tersisa paling banyak keep
+    try:
+        files = sorted((e for e in os.scandir(directory) if e.name.endswith(".mgr") and e.is_file()),
+                       key=lambda e: e.stat().st_mtime)
+    except OSError:
+        return
+    for entry in files[:max(0, len(files) - keep)]:
+        try:
+            os.remove(entry.path)
+        except OSError:
+            pass
+
+def read_replay(data):
+    # data: bytes atau path file -> (ReplayHeader, list[(jenis, nilai, ms)])
+    if isinstance(data, str):
+        with open(data, "rb") as f:
+            data = f.read()
+    magic, game, seed, p1, p2, started = REPLAY_HEADER.unpack_from(data)
+    if magic != REPLAY_MAGIC:
+        raise ValueError("Bukan file replay Multi Game App")
+    names = {code: name for name, code in REPLAY_GAMES.items()}
+    offset = REPLAY_HEADER.size
+    board = None
+    if names[game] == "snakes" and p2 & 1:
+        (size,) = REPLAY_BOARD_LEN.unpack_from(data, offset)
+        offset += REPLAY_BOARD_LEN.size
+        board = json.loads(bytes(data[offset:offset + size]))
+        offset += size
+    body = memoryview(data)[offset:]
+    body = body[:len(body) - len(body) % REPLAY_EVENT.size]
+    return ReplayHeader(names[game], seed, p1, p2, started, board), list(REPLAY_EVENT.iter_unpack(body))
+
+def replay_headless(data):
+    # Jalankan ulang seluruh log tanpa render; dadu dicek ulang terhadap seed
+    header, events = read_replay(data)
+    t0 = time.perf_counter()
+    rng = random.Random(header.seed)
+    if header.game == "snakes":
+        if header.board:
+            board = board_from_dict(header.board)
+            engine = SnakesEngine(board.players, board.ladders, board.snakes, board.size, rng)
+        else:
+            engine = SnakesEngine(SNAKES_PLAYERS[:header.param1 or 2], rng=rng)
+        for i, (kind, value, _) in enumerate(events):
+            move = engine.roll()
+            if move is None or move.dice != value:
+                raise ValueError(f"Replay tidak cocok di event {i}: dadu {value}")
+        state = {"positions": engine.positions, "winner": engine.winner, "turns": engine.turns}
+    elif header.game == "ttt":
+        engine = TicTacToeEngine(header.param1 or 3, header.param2 or 3)
+        for i, (kind, value, _) in enumerate(events):
+            if not engine.play(value):
+                raise ValueError(f"Replay tidak cocok di event {i}: kotak {value}")
+        state = {"board": engine.board, "winner": engine.winner, "draw": engine.draw}
+    else:
+        clock = [0.0]
+        engine = QuizEngine(rng, clock=lambda: clock[0])
+        engine.new_question()
+        for kind, value, ms in events:
+            if kind == EV_ANSWER:
+                clock[0] += ms / 1000
+                engine.submit(value)
+            engine.new_question()
+        state = {"score": engine.score, "total": engine.total, "tier": engine.tier}
+    return {"game": header.game, "seed": header.seed, "events": len(events),
+            "elapsed_ms": (time.perf_counter() - t0) * 1000, "state": state}
+
+class ReplayPlayer:
+    # Memutar event ke view di UI; speed 1 = kecepatan asli, 0 = secepat mungkin
+    def __init__(self, widget, view, events, speed=1.0, on_done=None):
+        self.widget = widget
+        self.view = view
+        self.events = events
+        self.speed = speed
+        self.on_done = on_done
+        self.pos = 0
+        self.job = None
+        self._schedule()
+
+    def _schedule(self):
+        if self.pos >= len(self.events):
+            self.job = None
+            if self.on_done:
+                self.on_done()
+            return
+        ms = self.events[self.pos][2]
+        delay = int(ms / self.speed) if self.speed > 0 else 0
+        self.job = self.widget.after(delay, self._step)
+
+    def _step(self):
+        kind, value, ms = self.events[self.pos]
+        self.pos += 1
+        self.view.replay_event(kind, value, ms)
+        self._schedule()
+
+    def stop(self):
+        if self.job is not None:
+            self.widget.after_cancel(self.job)
+            self.job = None
+
+# ---------------------------
+# Multiplayer online: server relay asyncio + klien untuk UI Tk
+# ---------------------------
+
+NET_HOST = "127.0.0.1"
+NET_PORT = 8765
+NET_POLL_MS = 30  # UI mengambil pesan masuk tiap interval ini lewat after()
+NET_MAX_LINE = 64 * 1024
+NET_MAX_BUFFER = 256 * 1024  # klien yang tidak membaca sampai buffer sebesar ini diputus
+NET_ROOM_SEATS = 2
+
+# Protokol: satu objek JSON per baris.
+#   klien -> server: {"t": "join", "room", "game", "size", "win"}, {"t": "move", "v"}, {"t": "reset"}
+#   server -> klien: {"t": "state", "seq", "seat", "s"}, {"t": "delta", "seq", "d"}, {"t": "error", "msg"}
+# State berupa dict datar ("pos.Merah", "c12", "turn", ...). Delta hanya berisi key yang
+# berubah; key yang hilang dikirim sebagai null. Satu langkah = satu delta beberapa byte.
+
+def net_encode(msg):
+    return (json.dumps(msg, separators=(",", ":")) + "\n").encode()
+
+def state_delta(old, new):
+    delta = {k: v for k, v in new.items() if old.get(k) != v}
+    for k in old:
+        if k not in new:
+            delta[k] = None
+    return delta
+
+def apply_delta(state, delta):
+    for k, v in delta.items():
+        if v is None:
+            state.pop(k, None)
+        else:
+            state[k] = v
+    return state
+
+class NetRoom:
+    # Server memegang engine; klien hanya mengirim niat (lempar / klik kotak)
+    def __init__(self, name, game, size=3, win_len=3):
+        self.name = name
+        self.game = game
+        self.size = size
+        self.win_len = win_len
+        self.clients = {}  # writer -> kursi (None = penonton)
+        self.seq = 0
+        self.reset()
+
+    def reset(self):
+        if self.game == "snakes":
+            self.engine = SnakesEngine(SNAKES_PLAYERS[:NET_ROOM_SEATS], rng=random.Random(new_seed()))
+            self.dice = 0
+        else:
+            self.engine = TicTacToeEngine(self.size, self.win_len)
+            self.order = {}  # kotak -> nomor langkah
+        self.state = self.snapshot()
+
+    def seated(self):
+        return [s for s in self.clients.values() if s is not None]
+
+    def snapshot(self):
+        e = self.engine
+        s = {"game": self.game, "players": len(self.seated())}
+        if self.game == "snakes":
+            s.update({f"pos.{p}": pos for p, pos in e.positions.items()})
+            s.update(turn=e.turn_idx, turns=e.turns, dice=self.dice)
+            if e.winner:
+                s["winner"] = e.winner
+        else:
+            s.update({f"c{i}": n for i, n in self.order.items()})
+            s.update(size=e.size, win=e.win_len, turn="XO".index(e.current_player))
+            if e.winner:
+                s["winner"] = e.winner
+                s["line"] = list(e.winning_line)
+            if e.draw:
+                s["draw"] = True
+        return s
+
+    def add(self, writer):
+        taken = self.seated()
+        free = [i for i in range(NET_ROOM_SEATS) if i not in taken]
+        self.clients[writer] = free[0] if free else None
+        return self.clients[writer]
+
+    def remove(self, writer):
+        self.clients.pop(writer, None)
+
+    def move(self, seat, value):
+        # None jika diterima, selain itu pesan kesalahan untuk pengirim
+        if seat is None:
+            return "Penonton tidak bisa jalan."
+        if len(self.seated()) < NET_ROOM_SEATS:
+            return "Menunggu lawan..."
+        if "winner" in self.state or "draw" in self.state:
+            return "Permainan selesai, tekan Reset."
+        if self.state["turn"] != seat:
+            return "Bukan giliranmu."
+        if self.game == "snakes":
+            self.dice = self.engine.roll().dice
+            return None
+        if not isinstance(value, int) or not 0 <= value < self.engine.cells or not self.engine.play(value):
+            return "Langkah tidak valid."
+        self.order[value] = len(self.order)
+        return None
+
+    def update(self):
+        new = self.snapshot()
+        delta = state_delta(self.state, new)
+        self.state = new
+        self.seq += 1
+        return {"t": "delta", "seq": self.seq, "d": delta}
+
+class RelayServer:
+    # Satu coroutine per koneksi; room kosong langsung dibuang. Tidak ada await saat
+    # broadcast: write() hanya menambah buffer, klien yang terlalu lambat diputus.
+    def __init__(self):
+        self.rooms = {}
+        self.stats = {"connections": 0, "messages": 0}
+
+    def send(self, writer, data):
+        if writer.is_closing():
+            return
+        writer.write(data)
+        if writer.transport.get_write_buffer_size() > NET_MAX_BUFFER:
+            writer.close()
+
+    def broadcast(self, room, msg, skip=None):
+        data = net_encode(msg)
+        for writer in list(room.clients):
+            if writer is not skip:
+                self.send(writer, data)
+
+    def send_state(self, room, writer):
+        self.send(writer, net_encode({"t": "state", "seq": room.seq, "seat": room.clients[writer],
+                                      "s": room.state}))
+
+    def error(self, writer, text):
+        self.send(writer, net_encode({"t": "error", "msg": text}))
+
+    def join(self, msg, writer):
+        game = msg.get("game")
+        if game not in ("snakes", "ttt"):
+            self.error(writer, "Game tidak dikenal.")
+            return None
+        key = (game, str(msg.get("room", "lobby"))[:64])
+        room = self.rooms.get(key)
+        if room is None:
+            variant = (msg.get("size", 3), msg.get("win", 3))
+            room = self.rooms[key] = NetRoom(key[1], game, *(variant if variant in TTT_VARIANTS else (3, 3)))
+        room.add(writer)
+        self.broadcast(room, room.update(), skip=writer)
+        self.send_state(room, writer)
+        return room
+
+    def leave(self, room, writer):
+        room.remove(writer)
+        if not room.clients:
+            self.rooms.pop((room.game, room.name), None)
+        else:
+            self.broadcast(room, room.update())
+
+    async def handle(self, reader, writer):
+        self.stats["connections"] += 1
+        room = None
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                self.stats["messages"] += 1
+                try:
+                    msg = json.loads(line)
+                    kind = msg["t"]
+                except (ValueError, KeyError, TypeError):
+                    self.error(writer, "Pesan tidak valid.")
+                    continue
+                if room is None:
+                    if kind == "join":
+                        room = self.join(msg, writer)
+                    else:
+                        self.error(writer, "Belum masuk room.")
+                elif kind == "move":
+                    err = room.move(room.clients[writer], msg.get("v"))
+                    if err:
+                        self.error(writer, err)
+                    else:
+                        self.broadcast(room, room.update())
+                elif kind == "reset":
+                    if room.clients[writer] is None:
+                        self.error(writer, "Penonton tidak bisa reset.")
+                        continue
+                    room.reset()
+                    room.seq += 1
+                    for w in list(room.clients):
+                        self.send_state(room, w)
+        except (ConnectionError, ValueError):
+            pass  # ValueError: baris melebihi NET_MAX_LINE
+        finally:
+            if room is not None:
+                self.leave(room, writer)
+            writer.close()
+
+def run_relay_server(host=NET_HOST, port=NET_PORT):
+    import asyncio
+    async def serve():
+        server = await asyncio.start_server(RelayServer().handle, host, port, limit=NET_MAX_LINE)
+        print(f"Relay server di {host}:{port} (Ctrl+C untuk berhenti)")
+        async with server:
+            await server.serve_forever()
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+
+class NetClient:
+    # Socket dan loop asyncio hidup di thread sendiri. Thread Tk hanya memanggil send()
+    # (call_soon_threadsafe) dan mengambil pesan dari antrean lewat after(), jadi tidak pernah blok.
+    def __init__(self, host, port, room, game, size=3, win_len=3):
+        self.inbox = queue.Queue()
+        self.state = {}
+        self.seat = None
+        self.seq = 0
+        self.writer = None
+        self.widget = None
+        self.handler = None
+        self.job = None
+        join = {"t": "join", "room": room, "game": game, "size": size, "win": win_len}
+        import asyncio
+        self.loop = asyncio.new_event_loop()
+        self.task = self.loop.create_task(self._run(host, port, join))
+        self.thread = threading.Thread(target=self._thread_main, name="net-client", daemon=True)
+        self.thread.start()
+
+    def _thread_main(self):
+        import asyncio
+        try:
+            self.loop.run_until_complete(self.task)
+        except asyncio.CancelledError:
+            pass
+        finally:
+            self.loop.close()
+
+    async def _run(self, host, port, join):
+        import asyncio
+        try:
+            reader, self.writer = await asyncio.open_connection(host, port, limit=NET_MAX_LINE)
+            self._write(join)
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                self.inbox.put(json.loads(line))
+            self.inbox.put({"t": "error", "msg": "Koneksi ke server terputus."})
+        except (OSError, ValueError) as e:
+            self.inbox.put({"t": "error", "msg": f"Koneksi gagal: {e}"})
+        finally:
+            if self.writer is not None:
+                self.writer.close()
+
+    def _write(self, msg):
+        if self.writer is not None and not self.writer.is_closing():
+            self.writer.write(net_encode(msg))
+
+    def send(self, msg):
+        try:
+            self.loop.call_soon_threadsafe(self._write, msg)
+        except RuntimeError:
+            pass  # loop sudah selesai (koneksi putus)
+
+    def attach(self, widget, handler):
+        # handler(msg, state_sebelumnya); self.state sudah berisi state terbaru
+        self.widget = widget
+        self.handler = handler
+        self._poll()
+
+    def _poll(self):
+        # Jadwal berikutnya di finally: error di handler tidak boleh menghentikan polling
+        try:
+            while True:
+                try:
+                    msg = self.inbox.get_nowait()
+                except queue.Empty:
+                    break
+                prev = self.state
+                if msg["t"] == "state":
+                    self.state, self.seat, self.seq = msg["s"], msg["seat"], msg["seq"]
+                elif msg["t"] == "delta":
+                    self.state = apply_delta(dict(prev), msg["d"])
+                    self.seq = msg["seq"]
+                try:
+                    self.handler(msg, prev)
+                except Exception as e:
+                    print(f"NetClient: pesan {msg['t']!r} gagal diproses: {e!r}", file=sys.stderr)
+                    self.handler({"t": "error", "msg": f"Gagal sinkron dengan server: {e}"}, prev)
+        finally:
+            self.job = self.widget.after(NET_POLL_MS, self._poll)
+
+    def close(self):
+        if self.job is not None:
+            try:
+                self.widget.after_cancel(self.job)
+            except Exception:
+                pass
+            self.job = None
+        try:
+            self.loop.call_soon_threadsafe(self.task.cancel)
+        except RuntimeError:
+            pass
+
+async def _net_bot(host, port, room, game, rng, latencies):
+    # Klien otomatis: jalan setiap gilirannya sampai permainan selesai
+    import asyncio
+    reader, writer = await asyncio.open_connection(host, port, limit=NET_MAX_LINE)
+    writer.write(net_encode({"t": "join", "room": room, "game": game}))
+    state, seat, sent = {}, None, None
+    try:
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+            msg = json.loads(line)
+            if msg["t"] == "state":
+                state, seat = msg["s"], msg["seat"]
+            elif msg["t"] == "delta":
+                apply_delta(state, msg["d"])
+            else:
+                break
+            if sent is not None:
+                latencies.append((time.perf_counter() - sent) * 1000)
+                sent = None
+            if "winner" in state or "draw" in state:
+                break
+            if seat == state["turn"] and state["players"] == NET_ROOM_SEATS:
+                move = {"t": "move"}
+                if game == "ttt":
+                    move["v"] = rng.choice([i for i in range(state["size"]**2) if f"c{i}" not in state])
+                sent = time.perf_counter()
+                writer.write(net_encode(move))
+    finally:
+        writer.close()
+
+def net_bench(rooms=200, game="snakes", seed=0):
+    # Server + 2 bot per room dalam satu proses di localhost
+    import asyncio
+    async def run():
+        relay = RelayServer()
+        server = await asyncio.start_server(relay.handle, NET_HOST, 0, limit=NET_MAX_LINE)
+        port = server.sockets[0].getsockname()[1]
+        rng = random.Random(seed)
+        latencies = []
+        t0 = time.perf_counter()
+        await asyncio.gather(*(_net_bot(NET_HOST, port, f"room-{i}", game, random.Random(rng.random()),
+                                        latencies)
+                               for i in range(rooms) for _ in range(NET_ROOM_SEATS)))
+        elapsed = time.perf_counter() - t0
+        server.close()
+        await server.wait_closed()
+        return {"game": game, "rooms": rooms, "moves": len(latencies), "elapsed_s": round(elapsed, 3),
+                "moves_per_s": round(len(latencies) / elapsed), "messages": relay.stats["messages"],
+                "latency_p50_ms": round(percentile(latencies, 50), 3),
+                "latency_p95_ms": round(percentile(latencies, 95), 3)}
+    return asyncio.run(run())
+
+# ---------------------------
+# Analisis layout Ular Tangga (Monte Carlo vektor + rantai Markov)
+# ---------------------------
+
+def load_numpy():
+    # numpy opsional dan mahal diimpor (~30 ms), jadi baru dimuat saat simulator dipakai
+    try:
+        import numpy
+    except ImportError:
+        raise RuntimeError("simulate_layout membutuhkan numpy (pip install numpy)") from None
+    return numpy
+
+def simulate_layout(games, players=2, ladders=None, snakes=None, board_size=10, seed=None,
+                    max_rounds=10000, chunk=250000):
+    # Semua permainan dijalankan paralel sebagai array posisi (games x players)
+    np = load_numpy()
+    ladders = DEFAULT_LADDERS if ladders is None else ladders
+    snakes = DEFAULT_SNAKES if snakes is None else snakes
+    goal = board_size**2
+    table = np.array(jump_table(ladders, snakes, board_size), dtype=np.int32)
+    rng = np.random.default_rng(seed)
+    turns = np.zeros(games, dtype=np.int64)
+    winners = np.full(games, -1, dtype=np.int64)
+    visits = np.zeros(goal + 1, dtype=np.int64)
+    t0 = time.perf_counter()
+    for lo in range(0, games, chunk):
+        n = min(chunk, games - lo)
+        pos = np.ones((n, players), dtype=np.int32)
+        active = np.arange(n)
+        rounds = 0
+        while active.size and rounds < max_rounds:
+            for k in range(players):
+                cur = pos[active, k]
+                nxt = cur + rng.integers(1, 7, size=active.size, dtype=np.int32)
+                nxt = table[np.where(nxt > goal, cur, nxt)]  # harus tepat di kotak terakhir
+                pos[active, k] = nxt
+                visits += np.bincount(nxt, minlength=goal + 1)
+                done = nxt == goal
+                if done.any():
+                    finished = active[done]
+                    winners[lo + finished] = k
+                    turns[lo + finished] = rounds * players + k + 1
+                    active = active[~done]
+                    if not active.size:
+                        break
+            rounds += 1
+    elapsed = time.perf_counter() - t0
+    finished = winners >= 0
+    done_turns = turns[finished]
+    wins = np.bincount(winners[finished], minlength=players)
+    return {
+        "game": "snakes-layout", "games": games, "players": players,
+        "unfinished": int(games - finished.sum()),
+        "mean_turns": float(done_turns.mean()) if done_turns.size else 0.0,
+        "median_turns": float(np.median(done_turns)) if done_turns.size else 0.0,
+        "p90_turns": float(np.percentile(done_turns, 90)) if done_turns.size else 0.0,
+        "turns_histogram": np.bincount(done_turns).tolist() if done_turns.size else [],
+        "win_rate": (wins / max(1, finished.sum())).tolist(),
+        "visits": visits[1:].tolist(),  # visits[i - 1] = berapa kali token berhenti di kotak i
+        "elapsed_s": elapsed, "games_per_s": games / elapsed if elapsed else 0.0,
+    }
+
+def transition_matrix(ladders, snakes, board_size=10):
+    # Matriks transisi satu lemparan untuk satu pemain; kotak terakhir = absorbing
+    goal = board_size**2
+    table = jump_table(ladders, snakes, board_size)
+    P = [[0.0] * (goal + 1) for _ in range(goal + 1)]
+    P[goal][goal] = 1.0
+    for i in range(1, goal):
+        for d in range(1, 7):
+            j = i + d if i + d <= goal else i
+            P[i][table[j]] += 1 / 6
+    return P
+
+def expected_turns_exact(ladders=None, snakes=None, board_size=10):
+    # Lemparan rata-rata satu pemain dari kotak 1: selesaikan (I - Q) t = 1
+    ladders = DEFAULT_LADDERS if ladders is None else ladders
+    snakes = DEFAULT_SNAKES if snakes is None else snakes
+    goal = board_size**2
+    P = transition_matrix(ladders, snakes, board_size)
+    n = goal - 1  # state transient 1..goal-1
+    try:
+        np = load_numpy()
+    except RuntimeError:
+        np = None
+    if np is not None:
+        # LAPACK: papan 30x30 (899 state) selesai dalam milidetik, bukan belasan detik
+        A = np.eye(n) - np.array(P)[1:goal, 1:goal]
+        try:
+            t = np.linalg.solve(A, np.ones(n))
+        except np.linalg.LinAlgError:
+            t = None
+        if t is None or not np.all(np.isfinite(t)) or np.abs(A @ t - 1).max() > 1e-6:
+            raise ValueError("Kotak terakhir tidak bisa dicapai dengan layout ini")
+        return float(t[0])
+    # Tanpa numpy: eliminasi Gauss-Jordan O(n^3) di Python murni
+    A = [[(1.0 if r == c else 0.0) - P[r + 1][c + 1] for c in range(n)] + [1.0] for r in range(n)]
+    for col in range(n):
+        pivot = max(range(col, n), key=lambda r: abs(A[r][col]))
+        if abs(A[pivot][col]) < 1e-12:
+            raise ValueError("Kotak terakhir tidak bisa dicapai dengan layout ini")
+        A[col], A[pivot] = A[pivot], A[col]
+        pv = A[col][col]
+        row = [v / pv for v in A[col]]
+        A[col] = row
+        for r in range(n):
+            if r != col and A[r][col]:
+                f = A[r][col]
+                A[r] = [a - f * b for a, b in zip(A[r], row)]
+    return A[0][n]
+
+def finish_distribution(ladders=None, snakes=None, board_size=10, max_turns=2000):
+    # f[t] = peluang satu pemain tepat mencapai kotak terakhir pada lemparan ke-t
+    ladders = DEFAULT_LADDERS if ladders is None else ladders
+    snakes = DEFAULT_SNAKES if snakes is None else snakes
+    goal = board_size**2
+    P = transition_matrix(ladders, snakes, board_size)
+    rows = [[(j, p) for j, p in enumerate(P[i]) if p] for i in range(goal + 1)]
+    dist = [0.0] * (goal + 1)
+    dist[1] = 1.0
+    f = [0.0]
+    for _ in range(max_turns):
+        nxt = [0.0] * (goal + 1)
+        for i in range(1, goal):
+            if dist[i]:
+                for j, p in rows[i]:
+                    nxt[j] += dist[i] * p
+        f.append(nxt[goal])
+        nxt[goal] = 0.0
+        dist = nxt
+    return f
+
+def analyze_layout_exact(ladders=None, snakes=None, board_size=10, players=2, max_turns=2000):
+    # Pemain tidak saling mempengaruhi, jadi hasil n pemain diturunkan dari distribusi satu pemain:
+    # pemain k menang di lemparan t jika pemain sebelum k belum selesai sampai t
+    # dan pemain sesudah k belum selesai sampai t - 1
+    f = finish_distribution(ladders, snakes, board_size, max_turns)
+    cdf = [0.0]
+    for t in range(1, len(f)):
+        cdf.append(cdf[-1] + f[t])
+    win = [0.0] * players
+    expected = 0.0
+    for t in range(1, len(f)):
+        for k in range(players):
+            p = f[t] * (1 - cdf[t]) ** k * (1 - cdf[t - 1]) ** (players - 1 - k)
+            win[k] += p
+            expected += p * ((t - 1) * players + k + 1)
+    return {
+        "game": "snakes-layout-exact", "players": players,
+        "expected_turns_single": expected_turns_exact(ladders, snakes, board_size),
+        "expected_turns": expected,
+        "win_rate": win,
+        "truncated_mass": 1 - cdf[-1],
+    }
+
+# ---------------------------
+# Pencarian layout paralel (ProcessPoolExecutor)
+# ---------------------------
+
+def check_layout_counts(n_ladders, n_snakes, board_size=10):
+    # Tiap tangga/ular butuh 2 kotak berbeda di antara kotak 2 .. kotak terakhir - 1
+    if n_ladders < 0 or n_snakes < 0:
+        raise ValueError("jumlah tangga/ular tidak boleh negatif")
+    free = board_size**2 - 2
+    if 2 * (n_ladders + n_snakes) > free:
+        raise ValueError(f"{n_ladders} tangga + {n_snakes} ular butuh {2 * (n_ladders + n_snakes)} kotak, "
+                         f"papan {board_size}x{board_size} hanya punya {free} (maks {free // 2} total)")
+
+def random_layout(rng, n_ladders=6, n_snakes=6, board_size=10):
+    # Semua ujung tangga/ular berbeda, tidak ada di kotak 1 maupun kotak terakhir
+    check_layout_counts(n_ladders, n_snakes, board_size)
+    goal = board_size**2
+    squares = rng.sample(range(2, goal), 2 * (n_ladders + n_snakes))
+    ladders, snakes = {}, {}
+    for i in range(n_ladders):
+        a, b = squares[2 * i], squares[2 * i + 1]
+        ladders[min(a, b)] = max(a, b)
+    for i in range(n_ladders, n_ladders + n_snakes):
+        a, b = squares[2 * i], squares[2 * i + 1]
+        snakes[max(a, b)] = min(a, b)
+    return ladders, snakes
+
+def score_layout(expected_turns, win_rate, target_turns, fairness_weight=2.0):
+    # Makin kecil makin baik: jarak relatif ke target + ketidakadilan urutan main
+    unfair = max(abs(w - 1 / len(win_rate)) for w in win_rate)
+    return abs(expected_turns - target_turns) / target_turns + fairness_weight * unfair
+
+def _search_chunk(job):
+    # Dijalankan di worker; seed per kandidat sehingga hasil tidak tergantung jumlah worker
+    (lo, hi, seed, target, players, n_ladders, n_snakes, board_size, mc_games) = job
+    results = []
+    for i in range(lo, hi):
+        rng = random.Random(f"{seed}:{i}")
+        ladders, snakes = random_layout(rng, n_ladders, n_snakes, board_size)
+        try:
+            if mc_games:
+                stats = simulate_layout(mc_games, players, ladders, snakes, board_size, seed=rng.getrandbits(32))
+                expected = stats["mean_turns"]
+            else:
+                stats = analyze_layout_exact(ladders, snakes, board_size, players, max_turns=1500)
+                expected = stats["expected_turns"]
+        except ValueError:
+            continue
+        results.append({
+            "candidate": i,
+            "score": score_layout(expected, stats["win_rate"], target),
+            "expected_turns": expected,
+            "win_rate": stats["win_rate"],
+            "ladders": ladders,
+            "snakes": snakes,
+        })
+    return results
+
+def process_pool(workers):
+    # forkserver (atau spawn), bukan fork: proses UI punya thread lain (Tk, ScoreStore, jaringan,
+    # turnamen) yang bisa sedang memegang lock saat fork dan membuat worker deadlock
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+    method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+    return ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context(method))
+
+def search_layouts(candidates, target_turns, players=2, n_ladders=6, n_snakes=6, board_size=10,
+                   seed=0, workers=None, chunk=16, top=10, mc_games=0):
+    check_layout_counts(n_ladders, n_snakes, board_size)  # gagal di sini, bukan di tiap worker
+    workers = workers or os.cpu_count() or 1
+    jobs = [(lo, min(lo + chunk, candidates), seed, target_turns, players,
+             n_ladders, n_snakes, board_size, mc_games)
+            for lo in range(0, candidates, chunk)]
+    best = []  # heap (-score, -candidate, result), simpan top-N saja
+    from concurrent.futures import as_completed
+    t0 = time.perf_counter()
+    with process_pool(workers) as pool:
+        for fut in as_completed([pool.submit(_search_chunk, job) for job in jobs]):
+            for r in fut.result():
+                item = (-r["score"], -r["candidate"], r)
+                if len(best) < top:
+                    heapq.heappush(best, item)
+                else:
+                    heapq.heappushpop(best, item)
+    ranked = [r for _, _, r in sorted(best, key=lambda t: (-t[0], -t[1]))]
+    for rank, r in enumerate(ranked, 1):
+        r["rank"] = rank
+    return {
+        "target_turns": target_turns, "players": players, "candidates": candidates,
+        "workers": workers, "seed": seed, "elapsed_s": time.perf_counter() - t0,
+        "layouts": ranked,
+    }
+
+# ---------------------------
+# AI Tic Tac Toe (tabel transposisi minimax, simetri 8 arah)
+# ---------------------------
+
+TTT_TABLE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "ttt_table.bin")
+TTT_TABLE_MAGIC = b"TTT1"
+TTT_TABLE_RECORD = struct.Struct("<H9b")
+TTT_TABLE_POSITIONS = 627  # jumlah posisi kanonik yang bisa dicapai dari papan kosong
+TTT_NO_MOVE = -128  # skor untuk kotak yang sudah terisi
+TTT_CELL_CODE = {"": 0, "X": 1, "O": 2}
+# Suhu softmax saat memilih langkah: 0 = selalu langkah terbaik
+TTT_DIFFICULTY = {"mudah": 8.0, "sedang": 2.0, "sulit": 0.0}
+
+def _ttt_symmetries():
+    # perm[j] = kotak asli yang dipetakan ke kotak j (4 rotasi x 2 refleksi)
+    rot = [6, 3, 0, 7, 4, 1, 8, 5, 2]
+    flip = [2, 1, 0, 5, 4, 3, 8, 7, 6]
+    perms = []
+    perm = list(range(9))
+    for _ in range(4):
+        perms.append(perm)
+        perms.append([perm[flip[j]] for j in range(9)])
+        perm = [perm[rot[j]] for j in range(9)]
+    return perms
+
+TTT_SYMMETRIES = _ttt_symmetries()
+
+def ttt_encode(cells):
+    # cells: 9 nilai 0/1/2 -> integer basis 3 (maks 3^9 - 1, muat di uint16)
+    code = 0
+    for v in reversed(cells):
+        code = code * 3 + v
+    return code
+
+def ttt_canonical(cells):
+    # (kode terkecil dari 8 simetri, perm yang menghasilkannya)
+    return min((ttt_encode([cells[i] for i in perm]), perm) for perm in TTT_SYMMETRIES)
+
+def _ttt_winner(cells):
+    for a, b, c in TTT_LINES:
+        if cells[a] and cells[a] == cells[b] == cells[c]:
+            return cells[a]
+    return 0
+
+def build_ttt_table():
+    # kode kanonik -> 9 skor langkah (dari sisi pemain yang jalan), orientasi kanonik.
+    # Menang cepat / kalah lambat diberi skor lebih besar.
+    table = {}
+
+    def value(cells, player):
+        code, perm = ttt_canonical(cells)
+        if code not in table:
+            canon = [cells[i] for i in perm]
+            scores = [TTT_NO_MOVE] * 9
+            empties = canon.count(0)
+            for j in range(9):
+                if canon[j]:
+                    continue
+                canon[j] = player
+                if _ttt_winner(canon):
+                    scores[j] = empties
+                elif empties == 1:
+                    scores[j] = 0
+                else:
+                    scores[j] = -value(canon, 3 - player)
+                canon[j] = 0
+            table[code] = scores
+        return max(table[code])
+
+    value([0] * 9, 1)
+    return table
+
+def save_ttt_table(table, path=TTT_TABLE_PATH):
+    with open(path, "wb") as f:
+        f.write(TTT_TABLE_MAGIC + struct.pack("<H", len(table)))
+        for code in sorted(table):
+            f.write(TTT_TABLE_RECORD.pack(code, *table[code]))
+
+def load_ttt_table(path=TTT_TABLE_PATH):
+    with open(path, "rb") as f:
+        data = f.read()
+    if data[:4] != TTT_TABLE_MAGIC:
+        raise ValueError(f"{path}: bukan tabel Tic Tac Toe")
+    (count,) = struct.unpack_from("<H", data, 4)
+    # File terpotong/rusak jangan sampai jadi tabel setengah: AI akan KeyError di tengah game
+    if count != TTT_TABLE_POSITIONS:
+        raise ValueError(f"{path}: {count} posisi, seharusnya {TTT_TABLE_POSITIONS}")
+    end = 6 + count * TTT_TABLE_RECORD.size
+    if len(data) < end:
+        raise ValueError(f"{path}: file terpotong ({len(data)} dari {end} byte)")
+    table = {}
+    for rec in TTT_TABLE_RECORD.iter_unpack(data[6:end]):
+        table[rec[0]] = list(rec[1:])
+    return table
+
+_ttt_table = None
+
+def ttt_table(path=TTT_TABLE_PATH):
+    # Dibuat sekali per proses; pakai file jika ada, kalau tidak bangun (beberapa ms) dan simpan
+    global _ttt_table
+    if _ttt_table is None:
+        try:
+            _ttt_table = load_ttt_table(path)
+        except (OSError, ValueError, struct.error):
+            _ttt_table = build_ttt_table()
+            try:
+                save_ttt_table(_ttt_table, path)
+            except OSError:
+                pass
+    return _ttt_table
+
+class TicTacToeAI:
+    def __init__(self, difficulty="sulit", rng=None):
+        self.difficulty = difficulty
+        self.rng = rng or random
+        self.table = ttt_table()
+
+    def move_scores(self, board):
+        # Skor tiap kotak untuk pemain yang sedang jalan: satu lookup + petakan balik simetri
+        cells = [TTT_CELL_CODE[v] for v in board]
+        code, perm = ttt_canonical(cells)
+        canon_scores = self.table[code]
+        scores = [TTT_NO_MOVE] * 9
+        for j, i in enumerate(perm):
+            scores[i] = canon_scores[j]
+        return scores
+
+    def choose(self, board):
+        scores = self.move_scores(board)
+        moves = [i for i, sc in enumerate(scores) if sc != TTT_NO_MOVE]
+        if not moves:
+            return None
+        temp = TTT_DIFFICULTY.get(self.difficulty, 0.0)
+        best = max(scores[i] for i in moves)
+        if temp <= 0:
+            return self.rng.choice([i for i in moves if scores[i] == best])
+        weights = [math.exp((scores[i] - best) / temp) for i in moves]
+        return self.rng.choices(moves, weights)[0]
+
+# ---------------------------
+# Turnamen bot vs bot (ProcessPoolExecutor, hasil dikirim balik per chunk)
+# ---------------------------
+
+TOURNAMENT_GAMES = 2000  # pertandingan per pasangan strategi
+TOURNAMENT_CHUNK = 250  # pertandingan per job worker; tiap job selesai langsung dilaporkan
+TOURNAMENT_REFRESH_MS = 250  # dashboard/progress diperbarui paling sering sekali per interval ini
+# Ular Tangga tidak punya keputusan selain lempar dadu, jadi hanya ada satu bot
+TOURNAMENT_BOTS = {"ttt": ["acak", "serakah", "mudah", "sedang", "sulit"], "snakes": ["dadu"]}
+
+def ttt_winning_move(engine, player):
+    # Kotak yang langsung membuat player menang menurut check_winner, atau None
+    for idx in engine.legal_moves():
+        engine.board[idx] = player
+        engine.bits[player] |= 1 << idx
+        won = engine.check_winner(idx)
+        engine.board[idx] = ""
+        engine.bits[player] &= ~(1 << idx)
+        if won:
+            engine.winning_line = None
+            return idx
+    return None
+
+def make_bot(game, name, rng):
+    # Bot = fungsi engine -> langkah (kotak untuk ttt, nilai dadu untuk snakes)
+    if game == "snakes":
+        return lambda engine: rng.randint(1, 6)
+    if name == "acak":
+        return lambda engine: rng.choice(engine.legal_moves())
+    if name == "serakah":
+        def greedy(engine):
+            # Menang kalau bisa, tutup langkah menang lawan, selain itu acak
+            other = "O" if engine.current_player == "X" else "X"
+            for player in (engine.current_player, other):
+                idx = ttt_winning_move(engine, player)
+                if idx is not None:
+                    return idx
+            return rng.choice(engine.legal_moves())
+        return greedy
+    ai = TicTacToeAI(name, rng)
+    return lambda engine: ai.choose(engine.board)
+
+def tournament_pairs(strategies):
+    # Round robin; satu strategi saja = main melawan dirinya sendiri
+    strategies = list(dict.fromkeys(strategies))
+    if len(strategies) == 1:
+        return [(strategies[0], strategies[0])]
+    return [(a, b) for i, a in enumerate(strategies) for b in strategies[i + 1:]]
+
+def tournament_seats(game, board=None):
+    # Ular Tangga dimainkan dengan jumlah pemain papan (2-8), Tic Tac Toe selalu 2
+    return len((board or DEFAULT_BOARD).players) if game == "snakes" else 2
+
+def tournament_jobs(game, strategies, games=TOURNAMENT_GAMES, seed=0, chunk=TOURNAMENT_CHUNK, board=None):
+    # Job diselang antar pasangan supaya semua pasangan maju bersamaan di dashboard
+    for name in strategies:
+        if name not in TOURNAMENT_BOTS[game]:
+            raise ValueError(f"strategi {name!r} tidak dikenal untuk {game}")
+    if game == "ttt":
+        ttt_table()  # tabel AI dibuat/disimpan sekali di sini, bukan oleh tiap worker bersamaan
+    b = board or DEFAULT_BOARD
+    layout = (b.ladders, b.snakes, b.size, tournament_seats(game, board)) if game == "snakes" else None
+    return [(game, a, bb, lo, min(lo + chunk, games), seed, layout)
+            for lo in range(0, games, chunk) for a, bb in tournament_pairs(strategies)]
+
+def _tournament_chunk(job):
+    # Dijalankan di worker; seed per pertandingan sehingga hasil tidak tergantung jumlah worker.
+    # Giliran pertama bergantian, jadi tiap strategi sama seringnya jalan duluan.
+    # seat_wins = kemenangan per urutan giliran (kursi 0 jalan duluan).
+    game, a, b, lo, hi, seed, layout = job
+    if game == "ttt":
+        engine = TicTacToeEngine()
+    else:
+        ladders, snakes, size, seats = layout
+        engine = SnakesEngine([f"P{k + 1}" for k in range(seats)], ladders, snakes, size)
+    seats = len(engine.players) if game == "snakes" else 2
+    part = {"pair": (a, b), "games": 0, "wins": [0, 0], "draws": 0, "seat_wins": [0] * seats, "turns": 0}
+    for i in range(lo, hi):
+        rng = random.Random(f"{seed}:{a}:{b}:{i}")
+        first = i % 2
+        names = (a, b) if first == 0 else (b, a)
+        bots = [make_bot(game, names[k % 2], rng) for k in range(seats)]
+        engine.reset()
+        if game == "ttt":
+            while not engine.game_over:
+                engine.play(bots[engine.filled % 2](engine))
+            seat = None if engine.draw else (engine.filled - 1) % 2
+            part["turns"] += engine.filled
+        else:
+            while not engine.game_over:
+                engine.roll(bots[engine.turn_idx](engine))
+            seat = engine.turn_idx
+            part["turns"] += engine.turns
+        part["games"] += 1
+        if seat is None:
+            part["draws"] += 1
+        else:
+            part["wins"][(seat % 2) ^ first] += 1
+            part["seat_wins"][seat] += 1
+    return part
+
+def iter_tournament(jobs, workers=None):
+    # Generator: hasil tiap job dikirim begitu selesai. close() membatalkan job yang belum jalan.
+    from concurrent.futures import as_completed
+    pool = process_pool(workers or os.cpu_count() or 1)
+    try:
+        for fut in as_completed([pool.submit(_tournament_chunk, job) for job in jobs]):
+            yield fut.result()
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+class TournamentTable:
+    # Agregat hasil chunk: per pasangan dan per strategi. Satu strategi saja (Ular Tangga)
+    # = semua pemain sama, jadi klasemen dibuat per urutan giliran, bukan per strategi.
+    def __init__(self, game, strategies, games=TOURNAMENT_GAMES, seats=2):
+        self.game = game
+        self.pairs = {pair: [0, 0, 0, 0] for pair in tournament_pairs(strategies)}  # menang a, menang b, seri, main
+        self.self_play = len(dict.fromkeys(strategies)) == 1
+        names = [f"giliran {k + 1}" for k in range(seats)] if self.self_play else dict.fromkeys(strategies)
+        self.bots = {name: [0, 0, 0, 0] for name in names}  # menang, kalah, seri, main
+        self.seat_wins = [0] * seats
+        self.total = len(self.pairs) * games
+        self.done = 0
+        self.turns = 0
+        self.t0 = time.perf_counter()
+
+    def add(self, part):
+        a, b = part["pair"]
+        wins_a, wins_b = part["wins"]
+        row = self.pairs[(a, b)]
+        row[0] += wins_a
+        row[1] += wins_b
+        row[2] += part["draws"]
+        row[3] += part["games"]
+        decided = part["games"] - part["draws"]
+        if self.self_play:
+            results = [(name, won, decided - won) for name, won in zip(self.bots, part["seat_wins"])]
+        else:
+            results = [(a, wins_a, wins_b), (b, wins_b, wins_a)]
+        for name, won, lost in results:
+            stats = self.bots[name]
+            stats[0] += won
+            stats[1] += lost
+            stats[2] += part["draws"]
+            stats[3] += part["games"]
+        self.done += part["games"]
+        self.turns += part["turns"]
+        for seat, won in enumerate(part["seat_wins"]):
+            self.seat_wins[seat] += won
+
+    def standings(self):
+        # (nama, main, % menang, % seri, % kalah), urut dari yang paling sering menang
+        rows = []
+        for name, (won, lost, draws, games) in self.bots.items():
+            n = games or 1
+            rows.append((name, games, won / n, draws / n, lost / n))
+        return sorted(rows, key=lambda r: (-r[2], -r[3], r[0]))
+
+    def report(self):
+        elapsed = time.perf_counter() - self.t0
+        decided = self.done - sum(row[2] for row in self.pairs.values())
+        return {
+            "game": self.game, "games": self.done, "total": self.total,
+            "elapsed_s": round(elapsed, 3), "games_per_s": round(self.done / elapsed) if elapsed else 0,
+            "mean_turns": round(self.turns / self.done, 2) if self.done else 0.0,
+            "first_player_win_rate": round(self.seat_wins[0] / decided, 4) if decided else 0.0,
+            "seat_win_rate": [round(w / decided, 4) if decided else 0.0 for w in self.seat_wins],
+            "standings": [{"strategy": name, "games": games, "win": round(w, 4), "draw": round(d, 4),
+                           "loss": round(lo, 4)} for name, games, w, d, lo in self.standings()],
+            "pairs": [{"a": a, "b": b, "wins_a": row[0], "wins_b": row[1], "draws": row[2], "games": row[3]}
+                      for (a, b), row in self.pairs.items()],
+        }
+
+def run_tournament(game, strategies=None, games=TOURNAMENT_GAMES, seed=0, workers=None,
+                   chunk=TOURNAMENT_CHUNK, board=None, progress=None):
+    # Versi headless; progress(table) dipanggil paling sering sekali per TOURNAMENT_REFRESH_MS
+    strategies = strategies or TOURNAMENT_BOTS[game]
+    jobs = tournament_jobs(game, strategies, games, seed, chunk, board)
+    table = TournamentTable(game, strategies, games, tournament_seats(game, board))
+    last = 0.0
+    for part in iter_tournament(jobs, workers):
+        table.add(part)
+        now = time.perf_counter()
+        if progress and now - last >= TOURNAMENT_REFRESH_MS / 1000:
+            last = now
+            progress(table)
+    if progress:
+        progress(table)
+    return table.report()
+
+# ---------------------------
+# Penyimpanan skor & sesi (SQLite WAL, ditulis dari thread latar)
+# ---------------------------
+
+SCORE_DB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "multi_game.db")
+
+SCORE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    id TEXT PRIMARY KEY, game TEXT NOT NULL, started REAL NOT NULL, ended REAL,
+    result TEXT, winner TEXT, score INTEGER, total INTEGER);
+CREATE TABLE IF NOT EXISTS moves (
+    session_id TEXT NOT NULL, seq INTEGER NOT NULL, player TEXT, move INTEGER, value INTEGER, ts REAL);
+CREATE TABLE IF NOT EXISTS quiz_answers (
+    session_id TEXT NOT NULL, question TEXT, answer INTEGER, correct INTEGER,
+    response_ms INTEGER, tier INTEGER, ts REAL);
+CREATE INDEX IF NOT EXISTS idx_sessions_game_winner ON sessions (game, winner);
+CREATE INDEX IF NOT EXISTS idx_sessions_game_score ON sessions (game, score DESC, total);
+CREATE INDEX IF NOT EXISTS idx_moves_session ON moves (session_id, seq);
+CREATE INDEX IF NOT EXISTS idx_quiz_session ON quiz_answers (session_id);
+"""
+
+# Semua penulisan masuk antrean dan di-flush per batch dalam satu transaksi oleh
+# thread latar, jadi main loop Tk tidak pernah menunggu disk. Pembacaan (leaderboard)
+# memakai koneksi terpisah; dengan WAL pembaca tidak terblokir penulis.
+class ScoreStore:
+    def __init__(self, path=SCORE_DB_PATH, flush_s=STORE_FLUSH_S, batch=STORE_BATCH):
+        self.path = path
+        self.flush_s = flush_s
+        self.batch = batch
+        self.queue = queue.Queue()
+        self.seq = {}
+        self.ready = threading.Event()
+        self.writer = threading.Thread(target=self._run, name="score-writer", daemon=True)
+        self.writer.start()  # tidak ditunggu: skema cukup siap sebelum query pertama
+        self.reader = None
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _run(self):
+        try:
+            conn = self._connect()
+            conn.executescript(SCORE_SCHEMA)
+        except sqlite3.Error as e:
+            print(f"ScoreStore: tidak bisa membuka {self.path}: {e}", file=sys.stderr)
+            conn = None
+        self.ready.set()
+        stop = False
+        while not stop:
+            pending = []
+            try:
+                item = self.queue.get(timeout=self.flush_s)
+            except queue.Empty:
+                continue
+            deadline = time.monotonic() + self.flush_s
+            while True:
+                if item is None:
+                    stop = True
+                    break
+                pending.append(item)
+                if len(pending) >= self.batch:
+                    break
+                try:
+                    item = self.queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+            if conn is not None and pending:
+                # Exception apa pun (mis. OverflowError saat bind) tidak boleh mematikan thread writer;
+                # batch yang gagal diulang per baris supaya hanya baris rusak yang dibuang
+                try:
+                    with conn:
+                        for sql, params in pending:
+                            conn.execute(sql, params)
+                except Exception as e:
+                    print(f"ScoreStore: batch {len(pending)} baris gagal ({e!r}), diulang per baris",
+                          file=sys.stderr)
+                    for sql, params in pending:
+                        try:
+                            with conn:
+                                conn.execute(sql, params)
+                        except Exception as e:
+                            print(f"ScoreStore: baris dibuang: {sql.split('(')[0].strip()} {e!r}",
+                                  file=sys.stderr)
+        if conn is not None:
+            conn.close()
+
+    def _put(self, sql, params):
+        self.queue.put((sql, params))
+
+    def start_session(self, game):
+        sid = uuid.uuid4().hex
+        self.seq[sid] = 0
+        self._put("INSERT INTO sessions (id, game, started) VALUES (?, ?, ?)", (sid, game, time.time()))
+        return sid
+
+    def end_session(self, sid, result, winner=None, score=None, total=None):
+        self.seq.pop(sid, None)
+        self._put("UPDATE sessions SET ended = ?, result = ?, winner = ?, score = ?, total = ? WHERE id = ?",
+                  (time.time(), result, winner, score, total, sid))
+
+    def update_score(self, sid, score, total):
+        self._put("UPDATE sessions SET score = ?, total = ?, ended = ? WHERE id = ?",
+                  (score, total, time.time(), sid))
+
+    def record_move(self, sid, player, move, value=None):
+        seq = self.seq.get(sid, 0)
+        self.seq[sid] = seq + 1
+        self._put("INSERT INTO moves VALUES (?, ?, ?, ?, ?, ?)", (sid, seq, player, move, value, time.time()))
+
+    def record_answer(self, sid, question, answer, correct, response_ms, tier):
+        self._put("INSERT INTO quiz_answers VALUES (?, ?, ?, ?, ?, ?, ?)",
+                  (sid, question, answer, int(correct), response_ms, tier, time.time()))
+
+    def _query(self, sql, params):
+        if self.reader is None:
+            self.ready.wait(5)
+            self.reader = sqlite3.connect(self.path)
+        try:
+            return self.reader.execute(sql, params).fetchall()
+        except sqlite3.Error:
+            return []
+
+    def top_winners(self, game, limit=10):
+        return self._query("SELECT winner, COUNT(*) FROM sessions WHERE game = ? AND winner IS NOT NULL "
+                           "GROUP BY winner ORDER BY COUNT(*) DESC LIMIT ?", (game, limit))
+
+    def top_winners_variants(self, game, limit=10):
+        # Semua varian sebuah game ("ttt", "ttt-ai", "ttt-5x5", ...): (varian, pemenang, jumlah)
+        return self._query("SELECT game, winner, COUNT(*) FROM sessions WHERE (game = ? OR game LIKE ?) "
+                           "AND winner IS NOT NULL GROUP BY game, winner ORDER BY COUNT(*) DESC LIMIT ?",
+                           (game, game + "-%", limit))
+
+    def top_scores(self, game="quiz", limit=10):
+        return self._query("SELECT score, total, ended FROM sessions WHERE game = ? AND score IS NOT NULL "
+                           "ORDER BY score DESC, total ASC LIMIT ?", (game, limit))
+
+    def close(self):
+        self.queue.put(None)
+        self.writer.join(10)
+        if self.reader is not None:
+            self.reader.close()
+            self.reader = None
+
+# ---------------------------
+# Registry game + plugin (diimpor saat pertama dibuka)
+# ---------------------------
+
+PLUGINS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "plugins")
+PLUGIN_GROUP = "multi_game.games"  # grup entry point untuk game dari paket terpasang
+PLUGIN_HEADER_LINES = 5  # baris awal file plugin yang dibaca untuk "# judul:" / "# status:"
+NAV_LINKS = 2  # jumlah tombol "Main ..." ke game lain di tiap view
+
+# Plugin: modul dengan fungsi create(parent, app) yang mengembalikan objek view (punya
+# .frame) atau sebuah Frame. Navigasi lewat app.nav_bar(frame, key) / app.open_game(key),
+# penyimpanan skor lewat app.store. Modul tidak diimpor sampai game dibuka pertama kali.
+# loader() -> create; source: "bawaan", path file plugin, atau "entry point <nilai>"
+GameEntry = namedtuple("GameEntry", "key title status source loader")
+
+def _plugin_file_loader(key, path):
+    def load():
+        spec = importlib.util.spec_from_file_location(f"multi_game_plugin_{key}", path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module.create
+    return load
+
+def _plugin_header(path):
+    # Metadata dari komentar di awal file, tanpa mengimpor modul
+    meta = {}
+    try:
+        with open(path, encoding="utf-8") as f:
+            for _ in range(PLUGIN_HEADER_LINES):
+                line = f.readline()
+                if line.startswith("#") and ":" in line:
+                    name, _, value = line[1:].partition(":")
+                    meta[name.strip().lower()] = value.strip()
+    except OSError:
+        pass
+    return meta
+
+class GameRegistry:
+    def __init__(self):
+        self.entries = OrderedDict()
+        self.factories = {}
+        self.import_ms = {}
+        self.errors = {}
+        self.discover_ms = 0.0
+
+    def register(self, key, title, loader, status="", source="bawaan"):
+        if key == "menu" or key in self.entries:
+            print(f"Game {key!r} dilewati: nama sudah dipakai", file=sys.stderr)
+            return
+        self.entries[key] = GameEntry(key, title, status or title, source, loader)
+
+    def discover(self, directory=PLUGINS_DIR, group=PLUGIN_GROUP):
+        # Hanya membaca nama file / metadata entry point; tidak ada modul plugin yang diimpor
+        t0 = time.perf_counter()
+        if directory and os.path.isdir(directory):
+            for name in sorted(os.listdir(directory)):
+                if not name.endswith(".py") or name.startswith("_"):
+                    continue
+                key = name[:-3]
+                path = os.path.join(directory, name)
+                meta = _plugin_header(path)
+                self.register(key, meta.get("judul", key.replace("_", " ").title()),
+                              _plugin_file_loader(key, path), meta.get("status", ""), path)
+        if group:
+            from importlib.metadata import entry_points
+            eps = entry_points()
+            eps = eps.select(group=group) if hasattr(eps, "select") else eps.get(group, [])
+            for ep in eps:
+                self.register(ep.name, ep.name.replace("_", " ").title(), ep.load,
+                              source=f"entry point {ep.value}")
+        self.discover_ms += (time.perf_counter() - t0) * 1000
+        return self
+
+    def factory(self, key):
+        # Impor modul game saat pertama dipakai; waktu impor dicatat per plugin
+        if key not in self.factories:
+            t0 = time.perf_counter()
+            self.factories[key] = self.entries[key].loader()
+            self.import_ms[key] = (time.perf_counter() - t0) * 1000
+            PROFILER.record(f"import_{key}", self.import_ms[key])
+        return self.factories[key]
+
+    def load_all(self):
+        for key in self.entries:
+            try:
+                self.factory(key)
+            except Exception as e:
+                self.errors[key] = f"{type(e).__name__}: {e}"
+
+    def report(self):
+        return {"discover_ms": round(self.discover_ms, 3),
+                "games": [{"key": e.key, "title": e.title, "source": e.source,
+                           "loaded": e.key in self.factories,
+                           "import_ms": round(self.import_ms[e.key], 3) if e.key in self.import_ms else None,
+                           "error": self.errors.get(e.key)}
+                          for e in self.entries.values()]}
+
+def default_registry(directory=PLUGINS_DIR, group=PLUGIN_GROUP):
+    # Game bawaan dulu, lalu plugin, Papan Skor terakhir di menu
+    registry = GameRegistry()
+    registry.register("snakes", "Ular Tangga", lambda: lambda parent, app: SnakesAndLadders(
+        parent, app, store=app.store, net=app.net_client("snakes"), board=app.board),
+        "Ular Tangga: lempar dadu, naik tangga, turun ular!")
+    registry.register("ttt", "Tic Tac Toe", lambda: lambda parent, app: TicTacToe(
+        parent, app, store=app.store, net=app.net_client("ttt")),
+        "Tic Tac Toe: tiga sejajar menang!")
+    registry.register("quiz", "Soal Hitung", lambda: lambda parent, app: MathQuiz(
+        parent, app, store=app.store),
+        "Soal Hitung: jawab cepat dan tepat!")
+    registry.discover(directory, group)
+    registry.register("tournament", "Turnamen AI", lambda: TournamentView,
+                      "Turnamen AI: bot vs bot di banyak proses, statistik diperbarui langsung.")
+    registry.register("leaderboard", "Papan Skor", lambda: lambda parent, app: Leaderboard(
+        parent, app.show_menu, app.store),
+        "Papan Skor: pemenang terbanyak dan skor tertinggi.")
+    return registry
+
 # ---------------------------
 # Main App
 # ---------------------------
 
+def estimate_view_cost(widget):
+    # Perkiraan kasar memori sebuah view: satu unit per widget dan per item canvas
+    cost = 1
+    if isinstance(widget, tk.Canvas):
+        cost += len(widget.find_all())
+    for child in widget.winfo_children():
+        cost += estimate_view_cost(child)
+    return cost
+
 class MultiGameApp:
-    def __init__(self, root):
+    def __init__(self, root, view_cache_size=VIEW_CACHE_SIZE, view_cache_budget=VIEW_CACHE_BUDGET,
+                 store=None, net=None, board=None, registry=None):
+        t_init = time.perf_counter()
+        # Waktu startup (ms): impor modul dihitung dari STARTUP_T0, sisanya dari awal __init__
+        self.startup = {"import_ms": (t_init - STARTUP_T0) * 1000}
+        self.t_init = t_init
+        self.on_interactive = None  # callback saat semua pekerjaan tertunda selesai
         self.root = root
+        # Entry point paket terpasang (importlib.metadata, ~25 ms) dicari setelah frame pertama
+        self.plugin_group = PLUGIN_GROUP if registry is None else None
+        self.registry = registry if registry is not None else default_registry(group=None)
+        self.board = board  # papan awal Ular Tangga (None = bawaan)
+        self.net = net  # (host, port, room) untuk main online, None = bergantian di satu komputer
+        self.store = store if store is not None else ScoreStore()
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
         self.root.title("Multi Game App - Colorful")
         self.root.geometry(f"{APP_W}x{APP_H}")
         self.root.resizable(True, True)
@@ -52,10 +2398,14 @@ class MultiGameApp:
         self.fullscreen = False
         self.root.bind("<F11>", self.toggle_fullscreen)
         self.root.bind("<Escape>", self.exit_fullscreen)
+        self.profiler_overlay = ProfilerOverlay(self.root)
+        self.root.bind("<F12>", self.profiler_overlay.toggle)
+        self.root.bind("<Control-F12>", self.profiler_overlay.dump)
 
-        self.bg = tk.Canvas(self.root, highlightthickness=0)
+        # Frame pertama memakai warna polos; gradasi digambar oleh <Configure> (debounce) sesudahnya
+        self.bg = tk.Canvas(self.root, highlightthickness=0, bg=shade(GRADIENT_COLORS[0], GRADIENT_SHADE))
         self.bg.pack(fill="both", expand=True)
-        self.bg.bind("<Configure>", lambda e: paint_gradient(self.bg))
+        self.background = GradientBackground(self.bg)
 
         self.container = tk.Frame(self.root, bg="#222222")
         self.container.place(relx=0.5, rely=0.5, anchor="center", relwidth=0.95, relheight=0.92)
@@ -69,61 +2419,207 @@ class MultiGameApp:
         self.status.pack(pady=(0, 12), fill="x")
 
         self.current_view = None
+        self.current_name = None
+        # name -> (frame, cost); view dibuat saat pertama dibuka lalu hanya di-pack_forget
+        self.views = OrderedDict()
+        self.view_objects = {}
+        self.view_cache_size = view_cache_size
+        self.view_cache_budget = view_cache_budget
+        self.menu_buttons = None
+        self.menu_utils = None
+        self.footer = None
+        # Yang tidak dibutuhkan untuk frame pertama dikerjakan satu per satu saat idle
+        self.deferred = deque([self.build_footer, self.build_menu_utils, self.discover_plugins])
         self.show_menu()
 
-        self.footer = tk.Label(self.container, text="F11: Fullscreen, Esc: Keluar Fullscreen",
+        self.deferred_started = False
+        self.status.bind("<Expose>", self.on_first_expose, add="+")
+        self.fallback_job = self.root.after(STARTUP_FALLBACK_MS, self.start_deferred)
+        self.startup["build_ms"] = (time.perf_counter() - t_init) * 1000
+
+    def on_first_expose(self, event=None):
+        # <Expose> pertama = jendela sudah tampil; frame-nya selesai digambar di putaran idle berikutnya
+        if "first_paint_ms" not in self.startup:
+            self.root.after_idle(self.mark_first_paint)
+
+    def mark_first_paint(self):
+        if "first_paint_ms" not in self.startup:
+            self.startup["first_paint_ms"] = (time.perf_counter() - self.t_init) * 1000
+            PROFILER.record("startup_first_paint", self.startup["first_paint_ms"])
+        self.start_deferred()
+
+    def start_deferred(self):
+        if self.deferred_started:
+            return
+        self.deferred_started = True
+        self.root.after_cancel(self.fallback_job)
+        self.root.after_idle(self.run_deferred)
+
+    def run_deferred(self):
+        # Satu tugas per putaran idle, agar event input di antaranya tetap diproses
+        if self.deferred:
+            try:
+                self.deferred.popleft()()
+            except tk.TclError:
+                pass  # jendela sudah ditutup
+            self.root.after_idle(self.run_deferred)
+            return
+        self.startup["interactive_ms"] = (time.perf_counter() - self.t_init) * 1000
+        PROFILER.record("startup_interactive", self.startup["interactive_ms"])
+        if self.on_interactive:
+            self.on_interactive()
+
+    def startup_report(self):
+        report = {k: round(v, 3) for k, v in self.startup.items()}
+        report["discover_ms"] = round(self.registry.discover_ms, 3)
+        report["budgets_ms"] = STARTUP_BUDGETS
+        return report
+
+    def build_footer(self):
+        self.footer = tk.Label(self.container, text="F11: Fullscreen, Esc: Keluar Fullscreen, F12: Profiling",
                                font=("Helvetica", 10), fg="#ffffff", bg="#333333", padx=8, pady=4)
         self.footer.pack(side="bottom", fill="x")
 
-    def show_menu(self):
+    def build_menu_utils(self):
+        if self.menu_utils is None or not self.menu_utils.winfo_exists() or self.menu_utils.winfo_children():
+            return
+        fancy_button(self.menu_utils, "Fullscreen", self.toggle_fullscreen).grid(row=0, column=0, padx=8)
+        fancy_button(self.menu_utils, "Keluar Fullscreen", self.exit_fullscreen).grid(row=0, column=1, padx=8)
+
+    def discover_plugins(self):
+        if not self.plugin_group:
+            return
+        before = len(self.registry.entries)
+        self.registry.discover(directory=None, group=self.plugin_group)
+        if len(self.registry.entries) != before:
+            if "leaderboard" in self.registry.entries:
+                self.registry.entries.move_to_end("leaderboard")  # Papan Skor tetap terakhir
+            self.fill_menu_buttons()
+
+    def show_view(self, name, build):
+        # build() mengembalikan objek view (punya .frame) atau langsung sebuah Frame
         self.clear_view()
+        if name in self.views:
+            self.views.move_to_end(name)
+            frame = self.views[name][0]
+        else:
+            with PROFILER.measure(f"open_{name}"):
+                view = build()
+            frame = getattr(view, "frame", view)
+            self.view_objects[name] = view
+            self.views[name] = (frame, estimate_view_cost(frame))
+            self.evict_views()
+        frame.pack(fill="both", expand=True)
+        self.current_view = frame
+        self.current_name = name
+        return self.view_objects[name]
+
+    def evict_views(self):
+        # Buang view yang paling lama tidak dipakai. View terbaru (yang akan tampil) dan view
+        # yang permainannya belum selesai tidak pernah dibuang, walau batas terlampaui.
+        cap = self.view_cache_size or len(self.registry.entries) + 1
+        newest = next(reversed(self.views))
+        for name in list(self.views):
+            if (len(self.views) <= cap and
+                    sum(c for _, c in self.views.values()) <= self.view_cache_budget):
+                break
+            view = self.view_objects.get(name)
+            if name == newest or (hasattr(view, "in_progress") and view.in_progress()):
+                continue
+            frame, _ = self.views.pop(name)
+            self.view_objects.pop(name, None)
+            if hasattr(view, "end_session"):
+                view.end_session()
+            try:
+                frame.destroy()
+            except Exception:
+                pass
+
+    def show_menu(self):
+        self.show_view("menu", self.build_menu)
+        self.status.config(text="Pilih salah satu permainan.")
+
+    def build_menu(self):
         menu = tk.Frame(self.container, bg="#222222")
-        menu.pack(expand=True, fill="both")
 
         fancy_label(menu, "Pilih Permainan").pack(pady=10, fill="x")
 
-        btn_wrap = tk.Frame(menu, bg="#222222")
-        btn_wrap.pack(pady=12)
-        fancy_button(btn_wrap, "Ular Tangga", self.open_snakes).grid(row=0, column=0, padx=10, pady=10)
-        fancy_button(btn_wrap, "Tic Tac Toe", self.open_ttt).grid(row=0, column=1, padx=10, pady=10)
-        fancy_button(btn_wrap, "Soal Hitung", self.open_quiz).grid(row=0, column=2, padx=10, pady=10)
+        self.menu_buttons = tk.Frame(menu, bg="#222222")
+        self.menu_buttons.pack(pady=12)
+        self.fill_menu_buttons()
 
-        util_wrap = tk.Frame(menu, bg="#222222")
-        util_wrap.pack(pady=8)
-        fancy_button(util_wrap, "Fullscreen", self.toggle_fullscreen).grid(row=0, column=0, padx=8)
-        fancy_button(util_wrap, "Keluar Fullscreen", self.exit_fullscreen).grid(row=0, column=1, padx=8)
+        self.menu_utils = tk.Frame(menu, bg="#222222")
+        self.menu_utils.pack(pady=8)
+        if self.build_menu_utils not in self.deferred:
+            self.build_menu_utils()  # menu dibangun ulang setelah startup: tidak perlu ditunda
+        return menu
 
-        self.current_view = menu
-        self.status.config(text="Pilih salah satu permainan.")
+    def fill_menu_buttons(self):
+        if self.menu_buttons is None or not self.menu_buttons.winfo_exists():
+            return
+        for child in self.menu_buttons.winfo_children():
+            child.destroy()
+        # Satu tombol per game di registry; modul plugin baru diimpor saat tombolnya ditekan
+        for i, entry in enumerate(self.registry.entries.values()):
+            fancy_button(self.menu_buttons, entry.title, lambda key=entry.key: self.open_game(key)).grid(
+                row=i // 4, column=i % 4, padx=10, pady=10)
 
     def clear_view(self):
+        # View tidak di-destroy, hanya disembunyikan agar bisa tampil lagi instan
         if self.current_view:
             try:
-                self.current_view.destroy()
+                self.current_view.pack_forget()
+                if self.current_name in self.views:
+                    # Hitung ulang biaya: isi view bisa bertambah selama dimainkan
+                    self.views[self.current_name] = (self.current_view,
+                                                     estimate_view_cost(self.current_view))
             except Exception:
                 pass
             self.current_view = None
-
-    def open_snakes(self):
-        self.status.config(text="Ular Tangga: lempar dadu, naik tangga, turun ular!")
-        self.clear_view()
-        view = SnakesAndLadders(self.container, self.show_menu, self.open_ttt, self.open_quiz)
-        self.current_view = view.frame
-        self.current_view.pack(fill="both", expand=True)
-
-    def open_ttt(self):
-        self.status.config(text="Tic Tac Toe: tiga sejajar menang!")
-        self.clear_view()
-        view = TicTacToe(self.container, self.show_menu, self.open_snakes, self.open_quiz)
-        self.current_view = view.frame
-        self.current_view.pack(fill="both", expand=True)
-
-    def open_quiz(self):
-        self.status.config(text="Soal Hitung: jawab cepat dan tepat!")
-        self.clear_view()
-        view = MathQuiz(self.container, self.show_menu, self.open_snakes, self.open_ttt)
-        self.current_view = view.frame
-        self.current_view.pack(fill="both", expand=True)
+            self.current_name = None
+
+    def net_client(self, game):
+        # Satu koneksi per view online; ditutup saat view di-destroy
+        if self.net is None:
+            return None
+        host, port, room = self.net
+        return NetClient(host, port, room, game)
+
+    def open_game(self, key):
+        entry = self.registry.entries[key]
+        cached = key in self.views
+        try:
+            view = self.show_view(key, lambda: self.registry.factory(key)(self.container, self))
+        except Exception as e:
+            # Plugin rusak tidak boleh menjatuhkan aplikasi: kembali ke menu dan tampilkan alasannya
+            print(f"Game {key} gagal dibuka: {e!r}", file=sys.stderr)
+            self.registry.errors[key] = f"{type(e).__name__}: {e}"
+            self.show_menu()
+            self.status.config(text=f"{entry.title} gagal dibuka: {e}")
+            return None
+        self.status.config(text=entry.status)
+        if cached and hasattr(view, "refresh"):
+            view.refresh()
+        return view
+
+    def nav_bar(self, parent, key):
+        # Tombol ke beberapa game lain (urutan registry) + kembali ke menu
+        nav = tk.Frame(parent, bg="#222222")
+        nav.pack(pady=8)
+        others = [e for e in self.registry.entries.values() if e.key != key][:NAV_LINKS]
+        for col, entry in enumerate(others):
+            fancy_button(nav, f"Main {entry.title}", lambda k=entry.key: self.open_game(k)).grid(
+                row=0, column=col, padx=5)
+        fancy_button(nav, "Kembali Menu", self.show_menu).grid(row=0, column=len(others), padx=5)
+        return nav
+
+    def on_close(self):
+        # Tutup sesi yang masih terbuka, lalu tunggu antrean skor ter-flush sebelum jendela ditutup
+        for view in self.view_objects.values():
+            if hasattr(view, "end_session"):
+                view.end_session()
+        self.store.close()
+        self.root.destroy()
 
     def toggle_fullscreen(self, event=None):
         self.fullscreen = not self.fullscreen
@@ -138,19 +2634,18 @@ class MultiGameApp:
 # ---------------------------
 
 class SnakesAndLadders:
-    def __init__(self, parent, back_cb, goto_ttt, goto_quiz):
+    def __init__(self, parent, app=None, store=None, net=None, board=None):
         self.frame = tk.Frame(parent, bg="#222222")
+        self.store = store
+        self.session = None  # dibuat saat lemparan pertama
+        self.net = net
 
         header = fancy_label(self.frame, "Ular Tangga")
         header.pack(pady=(6, 10), fill="x")
+        if app:
+            app.nav_bar(self.frame, "snakes")
 
-        nav = tk.Frame(self.frame, bg="#222222")
-        nav.pack(pady=8)
-        fancy_button(nav, "Main Tic Tac Toe", goto_ttt).grid(row=0, column=0, padx=5)
-        fancy_button(nav, "Main Soal Hitung", goto_quiz).grid(row=0, column=1, padx=5)
-        fancy_button(nav, "Kembali Menu", back_cb).grid(row=0, column=2, padx=5)
-
-        self.info = tk.Label(self.frame, text="Giliran: Merah", font=("Helvetica", 13, "bold"),
+        self.info = tk.Label(self.frame, text="", font=("Helvetica", 13, "bold"),
                              fg="#1b1b1b", bg="#ffdd77", padx=10, pady=6)
         self.info.pack(pady=(0, 8), fill="x")
 
@@ -167,290 +2662,662 @@ class SnakesAndLadders:
         controls.pack(pady=8)
         fancy_button(controls, "Lempar Dadu", self.roll).grid(row=0, column=0, padx=8)
         fancy_button(controls, "Reset", self.reset).grid(row=0, column=1, padx=8)
-
-        # State game
-        self.board_size = 10
+        self.board_btn = fancy_button(controls, "Papan", self.cycle_board)
+        self.board_btn.grid(row=0, column=2, padx=8)
+
+        # Papan bawaan + file JSON di boards/; online selalu memakai papan bawaan (sama dengan server)
+        if net:
+            board = None  # --board diabaikan: server hanya mengenal papan klasik 2 pemain
+        self.boards = [DEFAULT_BOARD] if net else load_boards()
+        if board is not None and board not in self.boards:
+            self.boards.append(board)
         self.margin = 12
         self.cell_px = 44  # nilai awal, akan dihitung ulang saat resize
-        self.players = ["Merah", "Biru"]
-        self.colors = {"Merah": "#e74c3c", "Biru": "#3498db"}
-        self.positions = {p: 1 for p in self.players}
-        self.turn_idx = 0
-        self.game_over = False
-        self.ladders = {3: 22, 5: 8, 11: 26, 20: 29, 27: 56, 36: 44}
-        self.snakes = {32: 10, 48: 26, 62: 18, 88: 24, 95: 56, 97: 78}
-        self.tokens = {}
-        self.highlight_item = None  # canvas item id untuk highlight
+        # Online: dadu dilempar server, jadi log replay lokal tidak bisa diverifikasi dari seed
+        self.recording = net is None
+        self.log = None
+        self.anim = AnimationScheduler(self.board)
+        self.resize_job = None
+        self.pending_size = None
 
         # Redraw saat ukuran berubah agar papan selalu muat
         self.board.bind("<Configure>", self.on_resize)
+        self.board.bind("<Destroy>", self._cancel_resize)
+        self.board.bind("<Destroy>", lambda e: self.anim.cancel_all(), add="+")
+        self.board.bind("<Destroy>", lambda e: self.log and self.log.close(), add="+")
+        self.board.bind("<Destroy>", lambda e: self.end_session(), add="+")
         # Gambar pertama kali
+        self.set_board(board or DEFAULT_BOARD)
+        if net:
+            self.info.config(text="Menghubungkan ke server...")
+            net.attach(self.board, self.on_net)
+            self.board.bind("<Destroy>", lambda e: net.close(), add="+")
+
+    def end_session(self):
+        # Permainan ditinggal sebelum selesai (reset / ganti papan / view dibuang)
+        if self.store and self.session:
+            self.store.end_session(self.session, "abandoned")
+            self.session = None
+
+    def in_progress(self):
+        return self.engine.turns > 0 and not self.engine.game_over
+
+    def set_board(self, board):
+        # Ganti definisi papan: engine, tabel koordinat, sprite dan scene dibangun ulang
+        self.end_session()
+        self.anim.cancel_all()
+        self.board_def = board
+        self.board_size = board.size
+        self.players = list(board.players)
+        self.colors = dict(zip(board.players, board.colors))
+        # Tiap ronde punya RNG sendiri dengan seed yang dicatat di log replay
+        self.seed = new_seed()
+        self.engine = SnakesEngine(self.players, board.ladders, board.snakes, board.size,
+                                   random.Random(self.seed))
+        if self.log:
+            self.log.close()
+        self.log = self.new_log() if self.recording else None
+        # Kotak -> (kolom, baris) dihitung sekali per papan; posisi piksel sekali per ukuran kotak
+        self.grid_xy = [None] + [serpentine_cell(i, board.size) for i in range(1, board.size**2 + 1)]
+        self.square_px = None
+        self.token_offset = {}
+
+        # Scene graph: satu gambar papan statis + garis tangga/ular + sprite token, dibuat sekali.
+        # Gambar papan, token dan cincin highlight dirender sekali per ukuran kotak.
+        self.board.delete("all")
+        self.board_item = None
+        self.jump_items = []  # (start, end, item_id)
+        self.tokens = {}
+        self.highlight_item = None  # canvas item id untuk highlight
+        self.highlight_target = None
+        self.atlas = SpriteAtlas(self.board, self.build_sprites)
+        self.sprites = None
+        self.laid_out_px = None
+        self.board_btn.config(text=f"Papan: {board.name}")
+        if self.pending_size:
+            self.fit_cells(*self.pending_size)
         self.draw_board()
+        self.info.config(text=f"Giliran: {self.players[0]}", bg="#ffdd77", fg="#1b1b1b")
+
+    def new_log(self):
+        board = None if self.board_def == DEFAULT_BOARD else board_to_dict(self.board_def)
+        return ReplayLog("snakes", self.seed, len(self.players), board=board)
+
+    def cycle_board(self):
+        if self.net:
+            self.info.config(text="Main online selalu memakai papan bawaan.")
+            return
+        idx = self.boards.index(self.board_def) if self.board_def in self.boards else -1
+        self.set_board(self.boards[(idx + 1) % len(self.boards)])
 
     def on_resize(self, event):
-        # Hitung cell_px berdasarkan ruang tersedia agar seluruh papan terlihat
-        avail_w = max(1, event.width - self.margin * 2)
-        avail_h = max(1, event.height - self.margin * 2)
-        self.cell_px = max(20, min(avail_w // self.board_size, avail_h // self.board_size))
+        # Banyak event <Configure> saat drag/F11: simpan ukuran terakhir saja,
+        # relayout dijalankan sekali setelah burst selesai
+        self.pending_size = (event.width, event.height)
+        if self.resize_job is not None:
+            self.board.after_cancel(self.resize_job)
+        self.resize_job = self.board.after(RESIZE_DEBOUNCE_MS, self._apply_resize)
+
+    def _cancel_resize(self, event=None):
+        if self.resize_job is not None:
+            try:
+                self.board.after_cancel(self.resize_job)
+            except Exception:
+                pass
+            self.resize_job = None
+
+    def _apply_resize(self):
+        self.resize_job = None
+        if not self.pending_size:
+            return
+        if not self.fit_cells(*self.pending_size):
+            return
+        # Posisikan ulang board dan token (tanpa membuat item baru)
+        self.draw_board()
+
+    def fit_cells(self, width, height):
+        # Hitung cell_px berdasarkan ruang tersedia agar seluruh papan terlihat; True jika berubah
+        avail_w = max(1, width - self.margin * 2)
+        avail_h = max(1, height - self.margin * 2)
+        min_cell = max(SNAKES_MIN_CELL_PX, SNAKES_MIN_BOARD_PX // self.board_size)
+        self.cell_px = max(min_cell, min(avail_w // self.board_size, avail_h // self.board_size))
+        if self.cell_px == self.laid_out_px:
+            return False
         # Set ukuran canvas minimum supaya tidak collapse
-        desired_w = self.margin * 2 + self.cell_px * self.board_size
-        desired_h = self.margin * 2 + self.cell_px * self.board_size
+        desired = self.margin * 2 + self.cell_px * self.board_size
         # Pastikan canvas cukup besar agar bagian bawah tidak tertutup oleh footer/container
-        self.board.config(width=desired_w, height=desired_h)
-        # Redraw board dan token
-        self.draw_board()
+        self.board.config(width=desired, height=desired)
+        return True
+
+    def idx_to_cell(self, idx):
+        # Kolom/baris grid untuk kotak idx (dari tabel, tidak dihitung ulang)
+        return self.grid_xy[idx]
 
     def idx_to_xy(self, idx):
-        idx -= 1
-        row = idx // self.board_size
-        col = idx % self.board_size
-        if row % 2 == 0:
-            x = col
-        else:
-            x = self.board_size - 1 - col
-        y = self.board_size - 1 - row
-        px = self.margin + x * self.cell_px
-        py = self.margin + y * self.cell_px
-        return px, py
+        # Pojok kiri atas kotak idx dalam piksel untuk cell_px saat ini
+        return self.square_px[idx]
 
+    @profiled("draw_board")
     def draw_board(self):
-        self.board.delete("all")
-        palette = ["#2a9d8f", "#e76f51", "#264653", "#f4a261", "#1d3557", "#a8dadc", "#e63946", "#457b9d"]
-        # Sel
-        for i in range(1, self.board_size**2 + 1):
-            x, y = self.idx_to_xy(i)
-            color = palette[i % len(palette)]
-            self.board.create_rectangle(x, y, x + self.cell_px, y + self.cell_px,
-                                        fill=color, width=1, outline="#ffffff")
-            self.board.create_text(x + self.cell_px/2, y + self.cell_px/2,
-                                   text=str(i), fill="#ffffff", font=("Helvetica", max(8, self.cell_px//5), "bold"))
+        if self.board_item is None:
+            self._build_scene()
+        self._layout_scene()
+
+    def build_sprites(self, c):
+        # Token lebih kecil jika lebih dari dua pemain berbagi satu kotak
+        if len(self.players) <= 2:
+            r, hr = max(8, c // 4), max(12, c // 3)
+        else:
+            r, hr = max(3, c // 6), max(5, c // 3)
+        sprites = {"board": (c * self.board_size, c * self.board_size,
+                             board_rects(self.board_size, c, self.idx_to_cell))}
+        for p in self.players:
+            sprites["token", p] = (2 * r, 2 * r, disc_rects(r, self.colors[p]))
+            sprites["ring", p] = (2 * hr, 2 * hr, disc_rects(hr, self.colors[p], hr - max(3, c // 12)))
+        return sprites
+
+    def _build_scene(self):
+        # Dibuat sekali saja; gambar dan posisi diatur oleh _layout_scene
+        self.board_item = self.board.create_image(self.margin, self.margin, anchor="nw")
         # Tangga dan ular
-        for s, e in self.ladders.items():
-            x1, y1 = self.idx_to_xy(s)
-            x2, y2 = self.idx_to_xy(e)
-            self.board.create_line(x1+self.cell_px/2, y1+self.cell_px/2,
-                                   x2+self.cell_px/2, y2+self.cell_px/2,
-                                   fill="#00c853", width=max(2, self.cell_px//8))
-        for s, e in self.snakes.items():
+        for s, e in self.engine.ladders.items():
+            self.jump_items.append((s, e, self.board.create_line(0, 0, 0, 0, fill="#00c853")))
+        for s, e in self.engine.snakes.items():
+            self.jump_items.append((s, e, self.board.create_line(0, 0, 0, 0, fill="#ff1744")))
+        # Highlight dibuat sekali (tersembunyi), token digambar di atasnya
+        self.highlight_item = self.board.create_image(0, 0, state="hidden")
+        for p in self.players:
+            self.tokens[p] = self.board.create_image(0, 0)
+
+    def _layout_scene(self):
+        c = self.cell_px
+        m = self.margin
+        self.square_px = [None] + [(m + x * c, m + y * c) for x, y in self.grid_xy[1:]]
+        # Token disebar melingkar di dalam kotak; pemain 1 kiri atas, pemain 2 kanan bawah
+        n = len(self.players)
+        spread = c * 0.25 if n > 1 else 0
+        for k, p in enumerate(self.players):
+            angle = math.pi * (1.25 + 2 * k / n)
+            self.token_offset[p] = (spread * math.cos(angle), spread * math.sin(angle))
+        self.sprites = self.atlas.get(c)
+        self.board.itemconfig(self.board_item, image=self.sprites["board"])
+        for p in self.players:
+            self.board.itemconfig(self.tokens[p], image=self.sprites["token", p])
+        if self.highlight_target:
+            self.board.itemconfig(self.highlight_item, image=self.sprites["ring", self.highlight_target])
+        line_w = max(2, c//8)
+        for s, e, item in self.jump_items:
             x1, y1 = self.idx_to_xy(s)
             x2, y2 = self.idx_to_xy(e)
-            self.board.create_line(x1+self.cell_px/2, y1+self.cell_px/2,
-                                   x2+self.cell_px/2, y2+self.cell_px/2,
-                                   fill="#ff1744", width=max(2, self.cell_px//8))
-        # Token pemain
-        # recreate tokens so coords reference valid canvas items after delete
-        self.tokens = {}
-        for p in self.players:
-            self.tokens[p] = self.board.create_oval(0, 0, 0, 0, fill=self.colors[p], outline="")
+            self.board.coords(item, x1 + c/2, y1 + c/2, x2 + c/2, y2 + c/2)
+            self.board.itemconfig(item, width=line_w)
+        self.laid_out_px = c
         self.update_tokens()
-        # recreate highlight (if exists) so it's on top
-        if self.highlight_item:
-            self.board.lift(self.highlight_item)
 
+    @profiled("update_tokens")
     def update_tokens(self):
-        offset_map = {"Merah": (-8, -8), "Biru": (8, 8)}
+        # Token yang sedang dianimasikan dibiarkan; frame berikutnya memakai cell_px baru
         for p in self.players:
-            x, y = self.idx_to_xy(self.positions[p])
-            dx, dy = offset_map[p]
-            r = max(8, self.cell_px // 4)
-            self.board.coords(self.tokens[p],
-                              x + self.cell_px/2 + dx - r, y + self.cell_px/2 + dy - r,
-                              x + self.cell_px/2 + dx + r, y + self.cell_px/2 + dy + r)
-        # If highlight exists, move it to the currently highlighted player (if any)
-        if self.highlight_item and self.highlight_target in self.players:
-            self._position_highlight(self.highlight_target)
+            if not self.anim.active(("token", p)):
+                self.place_token(p, *self.idx_to_cell(self.engine.positions[p]))
+
+    def place_token(self, player, gx, gy):
+        dx, dy = self.token_offset[player]
+        c = self.cell_px
+        cx = self.margin + gx * c + c/2
+        cy = self.margin + gy * c + c/2
+        self.board.coords(self.tokens[player], cx + dx, cy + dy)
+        if self.highlight_target == player:
+            self.board.coords(self.highlight_item, cx, cy)
+
+    def token_path(self, move):
+        # Frame (kolom, baris) per kotak lalu sepanjang garis tangga/ular
+        per_square = max(1, ANIM_STEP_MS * ANIM_FPS // 1000)
+        frames = []
+        cur = self.idx_to_cell(move.start)
+        for sq in range(move.start + 1, move.landed + 1):
+            nxt = self.idx_to_cell(sq)
+            frames.extend(lerp_points(cur, nxt, per_square))
+            cur = nxt
+        if move.end != move.landed:
+            frames.extend(lerp_points(cur, self.idx_to_cell(move.end),
+                                      max(1, ANIM_JUMP_MS * ANIM_FPS // 1000)))
+        return frames
 
     def _position_highlight(self, player):
-        # Place an outline (bigger oval) around the player's token
+        # Lingkaran di sekitar token pemain; item yang sama hanya dipindah
         if player not in self.players:
             return
-        # remove old highlight if exists
-        try:
-            if self.highlight_item:
-                self.board.delete(self.highlight_item)
-        except Exception:
-            pass
-        x, y = self.idx_to_xy(self.positions[player])
-        r = max(12, self.cell_px // 3)
-        hx0 = x + self.cell_px/2 - r
-        hy0 = y + self.cell_px/2 - r
-        hx1 = x + self.cell_px/2 + r
-        hy1 = y + self.cell_px/2 + r
-        color = "#ffffff" if player == "Merah" else "#ffffff"
-        self.highlight_item = self.board.create_oval(hx0, hy0, hx1, hy1, outline=self.colors[player],
-                                                     width=max(3, self.cell_px//12))
         self.highlight_target = player
-        # Ensure highlight is below token so token color is visible on top
-        self.board.lift(self.tokens[player])
-        # keep highlight for a short time then remove (handled by roll)
+        self.board.itemconfig(self.highlight_item, image=self.sprites["ring", player], state="normal")
+        self.board.tag_raise(self.tokens[player])
+        if not self.anim.active(("token", player)):
+            self.place_token(player, *self.idx_to_cell(self.engine.positions[player]))
 
     def _clear_highlight(self):
-        if self.highlight_item:
-            try:
-                self.board.delete(self.highlight_item)
-            except Exception:
-                pass
-            self.highlight_item = None
-            self.highlight_target = None
+        self.highlight_target = None
+        self.board.itemconfig(self.highlight_item, state="hidden")
 
-    def roll(self):
-        if self.game_over:
+    def roll(self, dice=None):
+        if self.net and dice is None:
+            # Online: minta server melempar, hasilnya datang lewat on_net
+            self.net.send({"t": "move"})
             return
-        player = self.players[self.turn_idx]
-        d = random.randint(1, 6)
-        new_pos = self.positions[player] + d
-        if new_pos > 100:
-            new_pos = self.positions[player]  # harus tepat di 100
-        if new_pos in self.ladders:
-            new_pos = self.ladders[new_pos]
-        elif new_pos in self.snakes:
-            new_pos = self.snakes[new_pos]
-        self.positions[player] = new_pos
-        self.update_tokens()
+        move = self.engine.roll(dice)
+        if move is None:
+            return
+        player, d, new_pos = move.player, move.dice, move.end
+        if self.log:
+            self.log.append(EV_ROLL, d)
+        if self.store:
+            if self.session is None:
+                self.session = self.store.start_session("snakes")
+            self.store.record_move(self.session, player, d, new_pos)
+            if move.winner:
+                self.store.end_session(self.session, "win", winner=player)
+                self.session = None
 
         # Visual mark: highlight player token and flash info bg with player's color
-        self._clear_highlight()
+        self.anim.cancel("mark")
         self._position_highlight(player)
-        old_bg = self.info.cget("bg")
         self.info.config(bg=self.colors[player], fg="#ffffff")
-        # schedule removal of highlight and restore info bg after 900 ms
+
         def restore_mark():
             self._clear_highlight()
-            try:
-                self.info.config(bg=old_bg, fg="#1b1b1b")
-            except Exception:
-                pass
-        self.board.after(900, restore_mark)
+            self.info.config(bg="#ffdd77", fg="#1b1b1b")
+
+        def arrived():
+            # Highlight bertahan 900 ms setelah token sampai
+            self.anim.later("mark", 900, restore_mark)
+            if move.winner:
+                toast(self.frame, f"{player} menang!", "win")
+
+        self.anim.play(("token", player), self.token_path(move),
+                       lambda pt: self.place_token(player, *pt), arrived)
 
         msg = f"{player} lempar dadu: {d}. Posisi: {new_pos}."
-        if new_pos == 100:
+        if move.winner:
             self.info.config(text=f"Pemenang: {player}")
-            self.game_over = True
-            messagebox.showinfo("Selesai", f"{player} menang!")
         else:
-            self.turn_idx = (self.turn_idx + 1) % len(self.players)
-            self.info.config(text=f"{msg} Giliran: {self.players[self.turn_idx]}")
+            self.info.config(text=f"{msg} Giliran: {self.engine.current_player}")
 
-    def reset(self):
-        self.positions = {p: 1 for p in self.players}
-        self.turn_idx = 0
-        self.game_over = False
+    def reset(self, seed=None):
+        if self.net:
+            self.net.send({"t": "reset"})
+            return
+        self.end_session()
+        self.anim.cancel_all()
+        if self.log:
+            self.log.close()
+        self.seed = new_seed() if seed is None else seed
+        self.engine.rng = random.Random(self.seed)
+        self.log = self.new_log() if self.recording else None
+        self.engine.reset()
         self._clear_highlight()
         self.update_tokens()
-        self.info.config(text="Giliran: Merah", bg="#ffdd77", fg="#1b1b1b")
+        self.info.config(text=f"Giliran: {self.players[0]}", bg="#ffdd77", fg="#1b1b1b")
+
+    def load_replay(self, header):
+        # Mode putar ulang: tidak menulis log/skor baru
+        self.recording = False
+        self.store = None
+        board = board_from_dict(header.board) if header.board else DEFAULT_BOARD
+        if board != self.board_def:
+            self.set_board(board)
+        self.reset(header.seed)
+
+    def replay_event(self, kind, value, ms):
+        self.roll()
+
+    def net_text(self):
+        state = self.net.state
+        me = self.players[self.net.seat] if self.net.seat is not None else "penonton"
+        if "winner" in state:
+            return f"Kamu: {me}. Pemenang: {state['winner']}"
+        if state["players"] < NET_ROOM_SEATS:
+            return f"Kamu: {me}. Menunggu lawan..."
+        return f"Kamu: {me}. Giliran: {self.engine.current_player}"
+
+    def on_net(self, msg, prev):
+        state = self.net.state
+        if msg["t"] == "state":
+            self.sync_state(state)
+        elif msg["t"] == "delta":
+            if state["turns"] > prev["turns"]:
+                self.roll(state["dice"])
+            if any(self.engine.positions[p] != state[f"pos.{p}"] for p in self.players):
+                self.sync_state(state)  # tidak cocok dengan server: ambil state server
+            elif "players" in msg["d"]:
+                self.info.config(text=self.net_text())
+        else:
+            self.info.config(text=msg["msg"])
+
+    def sync_state(self, state):
+        # State penuh dari server (saat masuk room atau setelah reset)
+        self.end_session()
+        self.anim.cancel_all()
+        self.engine.reset()
+        for p in self.players:
+            self.engine.positions[p] = state[f"pos.{p}"]
+        self.engine.turn_idx = state["turn"]
+        self.engine.turns = state["turns"]
+        self.engine.winner = state.get("winner")
+        self._clear_highlight()
+        self.update_tokens()
+        self.info.config(text=self.net_text(), bg="#ffdd77", fg="#1b1b1b")
 
 # ---------------------------
 # Tic Tac Toe
 # ---------------------------
 
 class TicTacToe:
-    def __init__(self, parent, back_cb, goto_snakes, goto_quiz):
+    def __init__(self, parent, app=None, store=None, net=None):
         self.frame = tk.Frame(parent, bg="#222222")
+        self.store = store
+        self.session = None
+        self.net = net
         header = fancy_label(self.frame, "Tic Tac Toe")
         header.pack(pady=(6, 10), fill="x")
-
-        nav = tk.Frame(self.frame, bg="#222222")
-        nav.pack(pady=8)
-        fancy_button(nav, "Main Ular Tangga", goto_snakes).grid(row=0, column=0, padx=5)
-        fancy_button(nav, "Main Soal Hitung", goto_quiz).grid(row=0, column=1, padx=5)
-        fancy_button(nav, "Kembali Menu", back_cb).grid(row=0, column=2, padx=5)
+        if app:
+            app.nav_bar(self.frame, "ttt")
 
         self.status = tk.Label(self.frame, text="Giliran: X", font=("Helvetica", 13, "bold"),
                                fg="#1b1b1b", bg="#ffdd77", padx=10, pady=6)
         self.status.pack(pady=(0, 8), fill="x")
 
-        board_wrap = tk.Frame(self.frame, bg="#000000")
-        board_wrap.pack(pady=8)
+        self.board_wrap = tk.Frame(self.frame, bg="#000000")
+        self.board_wrap.pack(pady=8)
 
-        self.current_player = "X"
-        self.board = [""] * 9
-        self.game_over = False
-        self.winning_line = None
+        self.variant_idx = 0
+        self.engine = TicTacToeEngine(*TTT_VARIANTS[self.variant_idx])
+        self.recording = net is None
+        self.seed = None
+        self.log = None
+        self.new_round()
+        self.buttons = []
+        self.canvas = None
+        self.build_board()
 
+        controls = tk.Frame(self.frame, bg="#222222")
+        controls.pack(pady=8)
+        fancy_button(controls, "Reset", self.reset).grid(row=0, column=0, padx=8)
+        self.mode_btn = fancy_button(controls, "Lawan: Teman", self.toggle_mode)
+        self.mode_btn.grid(row=0, column=1, padx=8)
+        self.level_btn = fancy_button(controls, "Level: sulit", self.cycle_level)
+        self.level_btn.grid(row=0, column=2, padx=8)
+        self.variant_btn = fancy_button(controls, self.variant_text(), self.cycle_variant)
+        self.variant_btn.grid(row=0, column=3, padx=8)
+
+        # Mode komputer: pemain = X, komputer = O. Tabel AI dimuat saat pertama dipakai.
+        self.ai = None
+        self.ai_level = "sulit"
+        self.ai_job = None
+        self.frame.bind("<Destroy>", lambda e: self._cancel_ai())
+        self.frame.bind("<Destroy>", lambda e: self.log and self.log.close(), add="+")
+        self.frame.bind("<Destroy>", lambda e: self.end_session(), add="+")
+        if net:
+            self.status.config(text="Menghubungkan ke server...")
+            net.attach(self.frame, self.on_net)
+            self.frame.bind("<Destroy>", lambda e: net.close(), add="+")
+
+    def new_round(self, seed=None):
+        # Seed baru per permainan; langkah manusia & komputer dicatat sebagai klik
+        if self.log:
+            self.log.close()
+        self.seed = new_seed() if seed is None else seed
+        self.rng = random.Random(self.seed)
+        if getattr(self, "ai", None):
+            self.ai.rng = self.rng
+        self.log = (ReplayLog("ttt", self.seed, self.engine.size, self.engine.win_len)
+                    if self.recording else None)
+
+    def variant_text(self):
+        return f"Papan: {self.engine.size}x{self.engine.size} ({self.engine.win_len} sejajar)"
+
+    def build_board(self):
+        for child in self.board_wrap.winfo_children():
+            child.destroy()
         self.buttons = []
-        for r in range(3):
-            for c in range(3):
-                idx = r * 3 + c
-                btn = tk.Button(board_wrap, text="", font=("Helvetica", 28, "bold"),
+        self.canvas = None
+        n = self.engine.size
+        if n >= TTT_CANVAS_MIN_SIZE:
+            # Papan besar: satu canvas, bukan ratusan tk.Button
+            self.cell_px = max(18, TTT_CANVAS_PX // n)
+            side = self.cell_px * n
+            self.canvas = tk.Canvas(self.board_wrap, width=side, height=side, bg="#1d3557",
+                                    highlightthickness=0)
+            self.canvas.pack(padx=6, pady=6)
+            for i in range(n + 1):
+                self.canvas.create_line(0, i * self.cell_px, side, i * self.cell_px, fill="#a8dadc")
+                self.canvas.create_line(i * self.cell_px, 0, i * self.cell_px, side, fill="#a8dadc")
+            self.mark_font = ("Helvetica", max(9, self.cell_px // 2), "bold")
+            self.canvas.bind("<Button-1>", self.on_canvas_click)
+            return
+        font_size = 28 if n <= 3 else 18
+        for r in range(n):
+            for c in range(n):
+                idx = r * n + c
+                btn = tk.Button(self.board_wrap, text="", font=("Helvetica", font_size, "bold"),
                                 width=4, height=2, bd=0, relief="ridge",
                                 activeforeground="#ffffff", activebackground="#444444",
                                 fg="#ffffff", bg=self.cell_color(r, c),
                                 command=lambda i=idx: self.handle(i))
-                btn.grid(row=r, column=c, padx=6, pady=6)
+                btn.grid(row=r, column=c, padx=6 if n <= 3 else 3, pady=6 if n <= 3 else 3)
                 self.buttons.append(btn)
 
-        controls = tk.Frame(self.frame, bg="#222222")
-        controls.pack(pady=8)
-        fancy_button(controls, "Reset", self.reset).grid(row=0, column=0, padx=8)
+    def on_canvas_click(self, event):
+        r, c = event.y // self.cell_px, event.x // self.cell_px
+        if 0 <= r < self.engine.size and 0 <= c < self.engine.size:
+            self.handle(r * self.engine.size + c)
+
+    def cycle_variant(self):
+        if self.net:
+            self.status.config(text="Ukuran papan ditentukan pembuat room.")
+            return
+        self._cancel_ai()
+        self.end_session()
+        self.variant_idx = (self.variant_idx + 1) % len(TTT_VARIANTS)
+        size, win_len = TTT_VARIANTS[self.variant_idx]
+        self.engine = TicTacToeEngine(size, win_len)
+        if size != 3 and self.ai is not None:
+            # Tabel AI hanya untuk 3x3
+            self.ai = None
+            self.mode_btn.config(text="Lawan: Teman")
+        self.variant_btn.config(text=self.variant_text())
+        self.build_board()
+        self.new_round()
+        self.status.config(text="Giliran: X")
+
+    def toggle_mode(self):
+        if self.net:
+            self.status.config(text="Lawan komputer tidak tersedia saat main online.")
+            return
+        if self.ai is None:
+            if self.engine.size != 3:
+                self.status.config(text="Lawan komputer hanya untuk papan 3x3.")
+                return
+            self.ai = TicTacToeAI(self.ai_level, self.rng)
+            self.mode_btn.config(text="Lawan: Komputer")
+        else:
+            self.ai = None
+            self.mode_btn.config(text="Lawan: Teman")
+        self.reset()
+
+    def cycle_level(self):
+        levels = list(TTT_DIFFICULTY)
+        self.ai_level = levels[(levels.index(self.ai_level) + 1) % len(levels)]
+        self.level_btn.config(text=f"Level: {self.ai_level}")
+        if self.ai:
+            self.ai.difficulty = self.ai_level
+
+    def _cancel_ai(self):
+        if self.ai_job is not None:
+            try:
+                self.frame.after_cancel(self.ai_job)
+            except Exception:
+                pass
+            self.ai_job = None
+
+    def ai_move(self):
+        self.ai_job = None
+        if self.ai and not self.engine.game_over:
+            self.apply_move(self.ai.choose(self.engine.board))
 
     def cell_color(self, r, c):
         palette = ["#2a9d8f", "#e76f51", "#264653", "#f4a261", "#1d3557", "#a8dadc"]
-        return palette[(r * 3 + c) % len(palette)]
+        return palette[(r * self.engine.size + c) % len(palette)]
 
     def handle(self, idx):
-        if self.game_over or self.board[idx] != "":
+        if self.net:
+            # Online: langkah baru ditampilkan setelah server mengirim delta
+            self.net.send({"t": "move", "v": idx})
             return
-        self.board[idx] = self.current_player
-        self.buttons[idx].config(text=self.current_player)
-
-        winner = self.check_winner()
-        if winner:
-            self.status.config(text=f"Pemenang: {winner}")
-            self.game_over = True
-            self.highlight()
+        # Klik pemain; diabaikan saat giliran komputer
+        if self.ai and self.engine.current_player == "O":
             return
+        if self.apply_move(idx) and self.ai and not self.engine.game_over:
+            self.ai_job = self.frame.after(AI_MOVE_DELAY_MS, self.ai_move)
+
+    def apply_move(self, idx):
+        player = self.engine.current_player
+        if not self.engine.play(idx):
+            return False
+        if self.log:
+            self.log.append(EV_CLICK, idx)
+        self.record_move(player, idx)
+        if self.canvas is not None:
+            r, c = divmod(idx, self.engine.size)
+            self.canvas.create_text((c + 0.5) * self.cell_px, (r + 0.5) * self.cell_px, text=player,
+                                    fill="#ffffff" if player == "X" else "#ffdd77",
+                                    font=self.mark_font, tags="mark")
+        else:
+            self.buttons[idx].config(text=player)
 
-        if "" not in self.board:
+        if self.engine.winner:
+            self.status.config(text=f"Pemenang: {self.engine.winner}")
+            self.highlight()
+        elif self.engine.draw:
             self.status.config(text="Seri!")
-            self.game_over = True
-            return
-
-        self.current_player = "O" if self.current_player == "X" else "X"
-        self.status.config(text=f"Giliran: {self.current_player}")
-
-    def check_winner(self):
-        lines = [
-            (0, 1, 2), (3, 4, 5), (6, 7, 8),
-            (0, 3, 6), (1, 4, 7), (2, 5, 8),
-            (0, 4, 8), (2, 4, 6)
-        ]
-        for a, b, c in lines:
-            if self.board[a] and self.board[a] == self.board[b] == self.board[c]:
-                self.winning_line = (a, b, c)
-                return self.board[a]
-        self.winning_line = None
-        return None
+        else:
+            self.status.config(text=f"Giliran: {self.engine.current_player}")
+        return True
+
+    def session_game(self):
+        n = self.engine.size
+        name = "ttt" if n == 3 else f"ttt-{n}x{n}"
+        return name + "-ai" if self.ai else name
+
+    def record_move(self, player, idx):
+        if not self.store:
+            return
+        if self.session is None:
+            self.session = self.store.start_session(self.session_game())
+        self.store.record_move(self.session, player, idx)
+        if self.engine.game_over:
+            self.store.end_session(self.session, "draw" if self.engine.draw else "win",
+                                   winner=self.engine.winner)
+            self.session = None
+
+    def end_session(self):
+        # Permainan ditinggal sebelum selesai (reset / ganti papan / ganti lawan)
+        if self.store and self.session:
+            self.store.end_session(self.session, "abandoned")
+            self.session = None
+
+    def in_progress(self):
+        return self.engine.filled > 0 and not self.engine.game_over
 
     def highlight(self):
-        if not self.winning_line:
+        if not self.engine.winning_line:
+            return
+        for i in self.engine.winning_line:
+            if self.canvas is not None:
+                r, c = divmod(i, self.engine.size)
+                item = self.canvas.create_rectangle(c * self.cell_px, r * self.cell_px,
+                                                    (c + 1) * self.cell_px, (r + 1) * self.cell_px,
+                                                    fill="#00c853", width=0, tags="mark")
+                self.canvas.lower(item, "mark")
+            else:
+                self.buttons[i].config(bg="#00c853")
+
+    def reset(self, seed=None):
+        if self.net:
+            self.net.send({"t": "reset"})
             return
-        for i in self.winning_line:
-            self.buttons[i].config(bg="#00c853")
+        self.clear(seed)
 
-    def reset(self):
-        self.board = [""] * 9
-        self.current_player = "X"
-        self.game_over = False
-        self.winning_line = None
+    def clear(self, seed=None):
+        self._cancel_ai()
+        self.end_session()
+        self.engine.reset()
+        self.new_round(seed)
         self.status.config(text="Giliran: X")
+        if self.canvas is not None:
+            self.canvas.delete("mark")
+        n = self.engine.size
         for i, btn in enumerate(self.buttons):
-            btn.config(text="", state="normal", bg=self.cell_color(i // 3, i % 3))
+            btn.config(text="", state="normal", bg=self.cell_color(i // n, i % n))
+
+    def load_replay(self, header):
+        self.recording = False
+        self.store = None
+        self.ai = None
+        self.mode_btn.config(text="Lawan: Teman")
+        if (self.engine.size, self.engine.win_len) != (header.param1, header.param2):
+            self.engine = TicTacToeEngine(header.param1, header.param2)
+            self.variant_btn.config(text=self.variant_text())
+            self.build_board()
+        self.reset(header.seed)
+
+    def replay_event(self, kind, value, ms):
+        self.apply_move(value)
+
+    def net_text(self):
+        state = self.net.state
+        me = "XO"[self.net.seat] if self.net.seat is not None else "penonton"
+        if state["players"] < NET_ROOM_SEATS:
+            return f"Kamu: {me}. Menunggu lawan..."
+        return f"Kamu: {me}. Giliran: {self.engine.current_player}"
+
+    def on_net(self, msg, prev):
+        state = self.net.state
+        if msg["t"] == "state":
+            self.sync_state(state)
+        elif msg["t"] == "delta":
+            for key in msg["d"]:
+                if key[0] == "c" and key not in prev and not self.apply_move(int(key[1:])):
+                    self.sync_state(state)  # tidak cocok dengan server: ambil state server
+                    return
+            if not self.engine.game_over:
+                self.status.config(text=self.net_text())
+        else:
+            self.status.config(text=msg["msg"])
+
+    def sync_state(self, state):
+        # State penuh dari server: papan dibangun ulang dengan memutar langkah sesuai urutannya
+        if (self.engine.size, self.engine.win_len) != (state["size"], state["win"]):
+            self.engine = TicTacToeEngine(state["size"], state["win"])
+            self.variant_btn.config(text=self.variant_text())
+            self.build_board()
+        self.clear()
+        for _, idx in sorted((n, int(k[1:])) for k, n in state.items() if k[0] == "c"):
+            self.apply_move(idx)
+        if not self.engine.game_over:
+            self.status.config(text=self.net_text())
 
 # ---------------------------
 # Math Quiz
 # ---------------------------
 
 class MathQuiz:
-    def __init__(self, parent, back_cb, goto_snakes, goto_ttt):
+    def __init__(self, parent, app=None, store=None):
         self.frame = tk.Frame(parent, bg="#222222")
+        self.store = store
+        self.session = None
         header = fancy_label(self.frame, "Soal Hitung")
         header.pack(pady=(6, 10), fill="x")
-
-        nav = tk.Frame(self.frame, bg="#222222")
-        nav.pack(pady=8)
-        fancy_button(nav, "Main Ular Tangga", goto_snakes).grid(row=0, column=0, padx=5)
-        fancy_button(nav, "Main Tic Tac Toe", goto_ttt).grid(row=0, column=1, padx=5)
-        fancy_button(nav, "Kembali Menu", back_cb).grid(row=0, column=2, padx=5)
+        if app:
+            app.nav_bar(self.frame, "quiz")
 
         self.status = tk.Label(self.frame, text="Jawab pertanyaan matematika sederhana.",
                                font=("Helvetica", 13, "bold"),
@@ -474,67 +3341,665 @@ class MathQuiz:
 
         stats = tk.Frame(body, bg="#222222")
         stats.pack(pady=6)
-        self.score = 0
-        self.total = 0
-        self.score_label = tk.Label(stats, text="Skor: 0/0", font=("Helvetica", 12, "bold"),
+        self.recording = True
+        self.seed = new_seed()
+        self.engine = QuizEngine(random.Random(self.seed))
+        self.log = ReplayLog("quiz", self.seed)
+        self.replay_clock = 0.0
+        self.score_label = tk.Label(stats, text="", font=("Helvetica", 12, "bold"),
                                     fg="#ffffff", bg="#2c3e50", padx=10, pady=6)
         self.score_label.pack()
+        self.update_score()
 
         controls = tk.Frame(self.frame, bg="#222222")
         controls.pack(pady=8)
-        fancy_button(controls, "Soal Baru", self.new_question).grid(row=0, column=0, padx=8)
+        fancy_button(controls, "Soal Baru", self.skip_question).grid(row=0, column=0, padx=8)
         fancy_button(controls, "Reset", self.reset).grid(row=0, column=1, padx=8)
 
-        self.current_answer = None
+        self.frame.bind("<Destroy>", lambda e: self.log and self.log.close())
+        self.frame.bind("<Destroy>", lambda e: self.end_session(), add="+")
         self.new_question()
 
+    def update_score(self):
+        self.score_label.config(text=f"Skor: {self.engine.score}/{self.engine.total}   "
+                                     f"Level: {self.engine.tier + 1}")
+
     def new_question(self):
-        ops = ["+", "-", "×", "÷"]
-        op = random.choice(ops)
-        a = random.randint(2, 20)
-        b = random.randint(2, 20)
-        if op == "÷":
-            b = random.randint(2, 10)
-            a = b * random.randint(2, 10)
-            self.current_answer = a // b
-        elif op == "×":
-            self.current_answer = a * b
-        elif op == "+":
-            self.current_answer = a + b
-        else:
-            a, b = max(a, b), min(a, b)
-            self.current_answer = a - b
-        self.question_label.config(text=f"{a} {op} {b} = ?")
+        self.question_label.config(text=self.engine.new_question())
         self.answer_var.set("")
         self.answer_entry.focus_set()
 
+    def skip_question(self):
+        if self.log:
+            self.log.append(EV_SKIP, 0)
+        self.new_question()
+
     def submit(self):
-        val = self.answer_var.get().strip()
-        if not val or not val.lstrip("-").isdigit():
-            messagebox.showinfo("Info", "Masukkan angka yang valid.")
+        try:
+            val = int(self.answer_var.get().strip())
+        except ValueError:
+            toast(self.frame, "Masukkan angka yang valid.", "error")
             return
-        user = int(val)
-        self.total += 1
-        if user == self.current_answer:
-            self.score += 1
+        if abs(val) > QUIZ_MAX_ANSWER:
+            toast(self.frame, "Angka terlalu besar.", "error")
+            return
+        answer = self.engine.current_answer
+        tier = self.engine.tier
+        correct = self.engine.submit(val)
+        if self.log:
+            self.log.append(EV_ANSWER, val, round(self.engine.last_response_s * 1000))
+        if correct:
             self.status.config(text="Benar!")
         else:
-            self.status.config(text=f"Salah. Jawaban: {self.current_answer}")
-        self.score_label.config(text=f"Skor: {self.score}/{self.total}")
+            self.status.config(text=f"Salah. Jawaban: {answer}")
+        if self.store:
+            if self.session is None:
+                self.session = self.store.start_session("quiz")
+            a, op, b = self.engine.question
+            self.store.record_answer(self.session, f"{a} {op} {b}", val, correct,
+                                     int(self.engine.last_response_s * 1000), tier)
+            self.store.update_score(self.session, self.engine.score, self.engine.total)
+        self.update_score()
         self.new_question()
 
-    def reset(self):
-        self.score = 0
-        self.total = 0
-        self.score_label.config(text="Skor: 0/0")
+    def end_session(self):
+        # Soal Hitung tidak punya akhir: sesi ditutup dengan skor terakhir (reset / view dibuang)
+        if self.store and self.session:
+            self.store.end_session(self.session, "ended", score=self.engine.score, total=self.engine.total)
+            self.session = None
+
+    def in_progress(self):
+        return self.engine.total > 0
+
+    def reset(self, seed=None):
+        # Sesi baru dibuat saat jawaban pertama
+        self.end_session()
+        if self.log:
+            self.log.close()
+        # Seed baru = bank soal baru; urutan soal bisa diputar ulang dari seed
+        self.seed = new_seed() if seed is None else seed
+        self.engine = QuizEngine(random.Random(self.seed),
+                                 clock=time.monotonic if self.recording else lambda: self.replay_clock)
+        self.log = ReplayLog("quiz", self.seed) if self.recording else None
+        self.update_score()
         self.status.config(text="Jawab pertanyaan matematika sederhana.")
         self.new_question()
 
+    def load_replay(self, header):
+        self.recording = False
+        self.store = None
+        self.replay_clock = 0.0
+        self.reset(header.seed)
+
+    def replay_event(self, kind, value, ms):
+        if kind == EV_ANSWER:
+            self.replay_clock += ms / 1000
+            self.answer_var.set(str(value))
+            self.submit()
+        else:
+            self.new_question()
+
+# ---------------------------
+# Benchmark (headless + UI lewat Xvfb)
+# ---------------------------
+
+BENCH_BOARD_SIZES = [400, 800, 1600, 2400]
+BENCH_GRADIENT_SIZES = [(900, 650), (1920, 1080), (3840, 2160)]
+BENCH_THRESHOLD = 0.20  # median lebih lambat >20% dari baseline = regresi
+
+def time_call(fn, reps):
+    times = []
+    for _ in range(reps):
+        t0 = time.perf_counter()
+        fn()
+        times.append((time.perf_counter() - t0) * 1000)
+    return summarize_ms(times)
+
+def summarize_ms(times):
+    import statistics
+    return {"median_ms": statistics.median(times), "min_ms": min(times), "max_ms": max(times),
+            "reps": len(times)}
+
+def start_virtual_display():
+    # Pakai DISPLAY yang ada; kalau tidak ada coba Xvfb. None = UI benchmark dilewati.
+    if os.environ.get("DISPLAY"):
+        return None, True
+    import shutil
+    import subprocess
+    if not shutil.which("Xvfb"):
+        return None, False
+    display = f":{90 + os.getpid() % 100}"
+    proc = subprocess.Popen(["Xvfb", display, "-screen", "0", "3840x2160x24", "-nolisten", "tcp"],
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    time.sleep(0.5)
+    os.environ["DISPLAY"] = display
+    return proc, True
+
+def bench_logic(reps):
+    results = {}
+    engine = SnakesEngine(rng=random.Random(1))
+
+    def rolls():
+        for _ in range(10000):
+            if engine.roll() is None:
+                engine.reset()
+    results["snakes_roll_10k"] = time_call(rolls, reps)
+    results["ttt_games_1k"] = time_call(lambda: simulate_ttt(1000, seed=1), reps)
+    quiz = QuizEngine(random.Random(1))
+
+    def questions():
+        for _ in range(10000):
+            quiz.new_question()
+    results["quiz_new_question_10k"] = time_call(questions, reps)
+    return results
+
+def bench_ui(reps):
+    results = {}
+    store = ScoreStore(":memory:")  # tidak menyentuh database skor sungguhan
+
+    registry = default_registry(directory=None, group=None)  # tanpa plugin terpasang
+
+    def startup():
+        root = tk.Tk()
+        MultiGameApp(root, store=store, registry=registry)
+        root.update()
+        root.destroy()
+    results["startup"] = time_call(startup, reps)
+
+    # Frame pertama dan siap dipakai (semua pekerjaan tertunda selesai), dari awal MultiGameApp()
+    paint, ready = [], []
+    for _ in range(reps):
+        root = tk.Tk()
+        app = MultiGameApp(root, store=store, registry=registry)
+        deadline = time.perf_counter() + 5
+        while "interactive_ms" not in app.startup and time.perf_counter() < deadline:
+            root.update()
+        paint.append(app.startup.get("first_paint_ms", app.startup.get("interactive_ms", 0.0)))
+        ready.append(app.startup.get("interactive_ms", 5000.0))
+        root.destroy()
+    results["startup_first_paint"] = summarize_ms(paint)
+    results["startup_interactive"] = summarize_ms(ready)
+
+    root = tk.Tk()
+    root.geometry(f"{APP_W}x{APP_H}")
+    try:
+        # cold: cache 1 view, setiap open membangun ulang; warm: view sudah di-cache
+        for label, cache in (("cold", 1), ("warm", VIEW_CACHE_SIZE)):
+            app = MultiGameApp(root, view_cache_size=cache, store=store, registry=registry)
+            root.update()
+            for key in ("snakes", "ttt", "quiz"):
+                if label == "warm":
+                    app.open_game(key)
+                    app.show_menu()
+                    root.update()
+
+                def go(key=key, app=app):
+                    app.open_game(key)
+                    root.update()
+                    app.show_menu()
+                    root.update()
+                results[f"open_{key}_{label}"] = time_call(go, reps)
+            for child in root.winfo_children():
+                child.destroy()
+
+        holder = tk.Frame(root)
+        holder.pack(fill="both", expand=True)
+        view = SnakesAndLadders(holder)
+        view.frame.pack(fill="both", expand=True)
+        root.update()
+        for size in BENCH_BOARD_SIZES:
+            def draw(size=size):
+                view.cell_px = max(20, (size - view.margin * 2) // view.board_size)
+                view.draw_board()
+                root.update_idletasks()
+            results[f"draw_board_{size}"] = time_call(draw, reps)
+
+            # Cold: cache sprite dikosongkan tiap rep, jadi build_sprites ikut diukur
+            def draw_cold(draw=draw):
+                view.atlas.sizes.clear()
+                draw()
+            results[f"draw_board_cold_{size}"] = time_call(draw_cold, reps)
+        holder.destroy()
+
+        canvas = tk.Canvas(root, highlightthickness=0)
+        canvas.pack(fill="both", expand=True)
+        for smooth in (False, True):
+            bg = GradientBackground(canvas, smooth=smooth)
+
+            def resize_burst(bg=bg):
+                for w, h in BENCH_GRADIENT_SIZES * 3:
+                    bg.paint(w, h)
+                root.update_idletasks()
+            results["paint_gradient_" + ("smooth" if smooth else "stripes")] = time_call(resize_burst, reps)
+            canvas.delete("all")
+    finally:
+        root.destroy()
+        store.close()
+    return results
+
+def run_benchmarks(reps=5, ui=True):
+    results = {"meta": {"reps": reps, "python": sys.version.split()[0], "time": time.time()}}
+    results.update(bench_logic(reps))
+    xvfb = None
+    if ui and tk is None:
+        results["meta"]["ui_skipped"] = "tkinter tidak terpasang"
+    elif ui:
+        xvfb, ok = start_virtual_display()
+        if ok:
+            try:
+                results.update(bench_ui(reps))
+            except tk.TclError as e:
+                results["meta"]["ui_skipped"] = str(e)
+        else:
+            results["meta"]["ui_skipped"] = "tidak ada DISPLAY maupun Xvfb"
+    if xvfb is not None:
+        xvfb.terminate()
+    return results
+
+def compare_benchmarks(results, baseline, threshold=BENCH_THRESHOLD):
+    # Daftar (nama, baseline ms, sekarang ms, rasio) yang melewati threshold
+    regressions = []
+    for name, cur in results.items():
+        base = baseline.get(name)
+        if name == "meta" or not base or not base.get("median_ms"):
+            continue
+        ratio = cur["median_ms"] / base["median_ms"]
+        if ratio > 1 + threshold:
+            regressions.append((name, base["median_ms"], cur["median_ms"], ratio))
+    return regressions
+
+# ---------------------------
+# Papan Skor
+# ---------------------------
+
+def ttt_variant_label(game):
+    # "ttt" -> "3x3", "ttt-5x5-ai" -> "5x5 vs AI" (lihat TicTacToe.session_game)
+    parts = game.split("-")[1:]
+    size = next((p for p in parts if "x" in p), "3x3")
+    return size + (" vs AI" if "ai" in parts else "")
+
+class Leaderboard:
+    def __init__(self, parent, back_cb, store):
+        self.store = store
+        self.frame = tk.Frame(parent, bg="#222222")
+        fancy_label(self.frame, "Papan Skor").pack(pady=(6, 10), fill="x")
+
+        nav = tk.Frame(self.frame, bg="#222222")
+        nav.pack(pady=8)
+        fancy_button(nav, "Muat Ulang", self.refresh).grid(row=0, column=0, padx=5)
+        fancy_button(nav, "Kembali Menu", back_cb).grid(row=0, column=1, padx=5)
+
+        body = tk.Frame(self.frame, bg="#222222")
+        body.pack(pady=10, fill="both", expand=True)
+        self.columns = {}
+        for col, (key, title) in enumerate([("snakes", "Ular Tangga"), ("ttt", "Tic Tac Toe"),
+                                            ("quiz", "Soal Hitung")]):
+            box = tk.Frame(body, bg="#34495e")
+            box.grid(row=0, column=col, padx=8, sticky="n")
+            tk.Label(box, text=title, font=("Helvetica", 14, "bold"), fg="#ffdd77",
+                     bg="#34495e", padx=10, pady=6).pack(fill="x")
+            self.columns[key] = tk.Label(box, text="", font=("Helvetica", 12), justify="left",
+                                         fg="#ffffff", bg="#34495e", padx=12, pady=8)
+            self.columns[key].pack(fill="x")
+        self.refresh()
+
+    def refresh(self):
+        rows = self.store.top_winners("snakes")
+        text = "\n".join(f"{i}. {winner}: {wins} menang" for i, (winner, wins) in enumerate(rows, 1))
+        self.columns["snakes"].config(text=text or "Belum ada data")
+        # Tic Tac Toe disimpan per varian (papan besar, lawan komputer): tampilkan semuanya
+        rows = self.store.top_winners_variants("ttt")
+        text = "\n".join(f"{i}. {winner}: {wins} menang ({ttt_variant_label(game)})"
+                         for i, (game, winner, wins) in enumerate(rows, 1))
+        self.columns["ttt"].config(text=text or "Belum ada data")
+        rows = self.store.top_scores("quiz")
+        text = "\n".join(f"{i}. {score}/{total}  ({time.strftime('%d-%m %H:%M', time.localtime(ended))})"
+                         for i, (score, total, ended) in enumerate(rows, 1))
+        self.columns["quiz"].config(text=text or "Belum ada data")
+
+# Proses worker berjalan di thread latar dan hanya mengisi antrean; view mengambil isinya
+# lewat after() tiap TOURNAMENT_REFRESH_MS dan menggambar sekali per tick, bukan per chunk.
+TOURNAMENT_TITLES = {"ttt": "Tic Tac Toe", "snakes": "Ular Tangga"}
+TOURNAMENT_BAR_W = 420
+TOURNAMENT_ROW_H = 30
+
+class TournamentView:
+    def __init__(self, parent, app=None, games=TOURNAMENT_GAMES, workers=None):
+        self.frame = tk.Frame(parent, bg="#222222")
+        self.games = games
+        self.workers = workers
+        fancy_label(self.frame, "Turnamen AI").pack(pady=(6, 10), fill="x")
+        if app:
+            app.nav_bar(self.frame, "tournament")
+
+        self.status = tk.Label(self.frame, text="Pilih game lalu tekan Mulai.", font=("Helvetica", 13, "bold"),
+                               fg="#1b1b1b", bg="#ffdd77", padx=10, pady=6)
+        self.status.pack(pady=(0, 8), fill="x")
+
+        controls = tk.Frame(self.frame, bg="#222222")
+        controls.pack(pady=8)
+        self.game = "ttt"
+        self.game_btn = fancy_button(controls, self.game_text(), self.cycle_game)
+        self.game_btn.grid(row=0, column=0, padx=8)
+        fancy_button(controls, "Mulai", self.start).grid(row=0, column=1, padx=8)
+        fancy_button(controls, "Berhenti", self.stop).grid(row=0, column=2, padx=8)
+
+        self.canvas = tk.Canvas(self.frame, width=TOURNAMENT_BAR_W + 260, highlightthickness=0, bg="#1d3557")
+        self.canvas.pack(pady=8)
+        self.pairs_label = tk.Label(self.frame, text="", font=("Courier", 10), justify="left",
+                                    fg="#ffffff", bg="#222222")
+        self.pairs_label.pack(pady=4)
+
+        self.table = None
+        self.bars = {}  # strategi -> (persegi menang, seri, kalah, teks persen)
+        self.updates = None
+        self.stop_flag = None
+        self.job = None
+        self.frame.bind("<Destroy>", lambda e: self.stop())
+
+    def game_text(self):
+        return f"Game: {TOURNAMENT_TITLES[self.game]}"
+
+    def cycle_game(self):
+        if self.running():
+            return
+        games = list(TOURNAMENT_BOTS)
+        self.game = games[(games.index(self.game) + 1) % len(games)]
+        self.game_btn.config(text=self.game_text())
+
+    def running(self):
+        return self.job is not None
+
+    def in_progress(self):
+        return self.running()
+
+    def start(self):
+        if self.running():
+            return
+        strategies = TOURNAMENT_BOTS[self.game]
+        jobs = tournament_jobs(self.game, strategies, self.games)
+        self.table = TournamentTable(self.game, strategies, self.games, tournament_seats(self.game))
+        self.build_bars()
+        # Antrean & flag baru per turnamen, jadi sisa hasil turnamen sebelumnya tidak tercampur
+        self.updates = queue.Queue()
+        self.stop_flag = threading.Event()
+        threading.Thread(target=self._run, args=(jobs, self.updates, self.stop_flag),
+                         name="tournament", daemon=True).start()
+        self.status.config(text=f"Turnamen {TOURNAMENT_TITLES[self.game]} berjalan...")
+        self.job = self.frame.after(TOURNAMENT_REFRESH_MS, self.poll)
+
+    def _run(self, jobs, updates, stop_flag):
+        parts = iter_tournament(jobs, self.workers)
+        try:
+            for part in parts:
+                updates.put(part)
+                if stop_flag.is_set():
+                    break
+        except Exception as e:
+            updates.put({"error": f"{type(e).__name__}: {e}"})
+        finally:
+            parts.close()
+            updates.put(None)
+
+    def stop(self):
+        if self.stop_flag is not None:
+            self.stop_flag.set()
+        if self.job is None:
+            return
+        self.job, job = None, self.job
+        try:
+            self.frame.after_cancel(job)
+            self.status.config(text=f"Dihentikan: {self.table.done}/{self.table.total} pertandingan.")
+        except tk.TclError:
+            pass  # view sudah di-destroy
+
+    def poll(self):
+        # Semua chunk yang masuk sejak tick terakhir digabung, lalu digambar sekali
+        self.job = None
+        finished = error = None
+        while True:
+            try:
+                part = self.updates.get_nowait()
+            except queue.Empty:
+                break
+            if part is None:
+                finished = True
+            elif "error" in part:
+                error = part["error"]
+            else:
+                self.table.add(part)
+        self.draw()
+        if error:
+            self.status.config(text=f"Turnamen gagal: {error}")
+        elif finished:
+            report = self.table.report()
+            self.status.config(text=f"Selesai: {report['games']} pertandingan, "
+                                    f"{report['games_per_s']} pertandingan/detik.")
+        else:
+            self.job = self.frame.after(TOURNAMENT_REFRESH_MS, self.poll)
+
+    def build_bars(self):
+        # Item canvas dibuat sekali per turnamen; draw() hanya memindah koordinat & teks
+        self.canvas.delete("all")
+        self.bars = {}
+        for row, name in enumerate(self.table.bots):
+            y = 10 + row * TOURNAMENT_ROW_H
+            self.canvas.create_text(10, y + 10, text=name, anchor="w", fill="#ffffff",
+                                    font=("Helvetica", 11, "bold"))
+            rects = [self.canvas.create_rectangle(100, y, 100, y + 20, width=0, fill=color)
+                     for color in ("#1dd1a1", "#feca57", "#ff6b6b")]
+            text = self.canvas.create_text(110 + TOURNAMENT_BAR_W, y + 10, text="", anchor="w",
+                                           fill="#ffffff", font=("Courier", 10))
+            self.bars[name] = (*rects, text)
+        self.canvas.config(height=20 + len(self.bars) * TOURNAMENT_ROW_H)
+
+    @profiled("tournament_draw")
+    def draw(self):
+        for name, games, win, draw, loss in self.table.standings():
+            *rects, text = self.bars[name]
+            _, y0, _, y1 = self.canvas.coords(rects[0])
+            x = 100
+            for item, rate in zip(rects, (win, draw, loss)):
+                w = rate * TOURNAMENT_BAR_W if games else 0
+                self.canvas.coords(item, x, y0, x + w, y1)
+                x += w
+            self.canvas.itemconfig(text, text=f"M {win:5.1%}  S {draw:5.1%}  K {loss:5.1%}")
+        # Main melawan diri sendiri: baris pasangan tidak bermakna, klasemen sudah per giliran
+        self.pairs_label.config(text="" if self.table.self_play else "\n".join(
+            [f"{'pasangan':<20}{'menang':>14}{'seri':>7}"] +
+            [f"{a + ' vs ' + b:<20}{row[0]:>7}-{row[1]:<6}{row[2]:>7}" for (a, b), row in self.table.pairs.items()]))
+        report = self.table.report()
+        self.status.config(text=f"{report['games']}/{report['total']} pertandingan, "
+                                f"{report['games_per_s']} per detik, pemain pertama menang "
+                                f"{report['first_player_win_rate']:.1%}")
+
 # ---------------------------
 # Run
 # ---------------------------
 
-if __name__ == "__main__":
+TK_MISSING = ("tkinter tidak terpasang (mis. apt install python3-tk). Tanpa UI tersedia: "
+              "simulate, layout, search, tournament, replay --headless, bench --no-ui")
+
+def run_app(net=None, board=None, startup_report=False):
+    if tk is None:
+        sys.exit(TK_MISSING)
     root = tk.Tk()
-    app = MultiGameApp(root)
-    root.mainloop()
\ No newline at end of file
+    app = MultiGameApp(root, net=net, board=board)
+    if startup_report:
+        app.on_interactive = lambda: print(json.dumps(app.startup_report()), flush=True)
+    root.mainloop()
+
+def main(argv=None):
+    # Tanpa argumen: jalankan UI. "simulate" berjalan headless tanpa membuat widget.
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv:
+        return run_app()  # jalur cepat: argparse tidak perlu diimpor
+    import argparse
+    parser = argparse.ArgumentParser(description="Multi Game App")
+    parser.add_argument("--connect", metavar="HOST:PORT", default=None,
+                        help="main Ular Tangga / Tic Tac Toe online lewat server relay")
+    parser.add_argument("--room", default="lobby")
+    parser.add_argument("--board", default=None, help="file JSON papan Ular Tangga")
+    parser.add_argument("--startup-report", action="store_true",
+                        help="cetak waktu startup (impor, frame pertama, siap dipakai) sebagai JSON")
+    sub = parser.add_subparsers(dest="command")
+    sim = sub.add_parser("simulate", help="jalankan banyak permainan tanpa UI")
+    sim.add_argument("game", choices=sorted(SIMULATORS))
+    sim.add_argument("-n", "--count", type=int, default=10000)
+    sim.add_argument("--seed", type=int, default=None)
+    lay = sub.add_parser("layout", help="analisis layout Ular Tangga (Monte Carlo numpy / Markov)")
+    lay.add_argument("-n", "--games", type=int, default=1000000)
+    lay.add_argument("-p", "--players", type=int, default=2)
+    lay.add_argument("--seed", type=int, default=None)
+    lay.add_argument("--exact", action="store_true", help="hitung dari rantai Markov, tanpa sampling")
+    lay.add_argument("--board", dest="layout_board", default=None, help="file JSON papan (bawaan: klasik)")
+    tbl = sub.add_parser("ttt-table", help="bangun dan simpan tabel AI Tic Tac Toe")
+    tbl.add_argument("-o", "--output", default=TTT_TABLE_PATH)
+    srch = sub.add_parser("search", help="cari layout Ular Tangga untuk target panjang permainan")
+    srch.add_argument("-t", "--target", type=float, required=True, help="target rata-rata lemparan per permainan")
+    srch.add_argument("-n", "--candidates", type=int, default=1000)
+    srch.add_argument("-p", "--players", type=int, default=2)
+    srch.add_argument("--ladders", type=int, default=6)
+    srch.add_argument("--snakes", type=int, default=6)
+    srch.add_argument("--workers", type=int, default=None)
+    srch.add_argument("--chunk", type=int, default=16)
+    srch.add_argument("--top", type=int, default=10)
+    srch.add_argument("--seed", type=int, default=0)
+    srch.add_argument("--mc-games", type=int, default=0, help="pakai Monte Carlo (numpy) bukan solver exact")
+    srch.add_argument("-o", "--output", default=None, help="tulis hasil JSON ke file")
+    bench = sub.add_parser("bench", help="benchmark rendering, navigasi dan logika game")
+    bench.add_argument("-r", "--reps", type=int, default=5)
+    bench.add_argument("-o", "--output", default="bench.json")
+    bench.add_argument("--baseline", default=None, help="bandingkan dengan hasil JSON sebelumnya")
+    bench.add_argument("--threshold", type=float, default=BENCH_THRESHOLD)
+    bench.add_argument("--no-ui", action="store_true", help="hanya benchmark logika (tanpa Tk)")
+    rpl = sub.add_parser("replay", help="putar ulang log replay (.mgr)")
+    rpl.add_argument("path")
+    rpl.add_argument("--headless", action="store_true", help="tanpa UI, secepat mungkin")
+    rpl.add_argument("--speed", type=float, default=1.0, help="1 = kecepatan asli, 0 = tanpa jeda")
+    plg = sub.add_parser("plugins", help="daftar game/plugin dan biaya impor masing-masing")
+    plg.add_argument("--import", dest="load", action="store_true", help="impor semua plugin dan ukur waktunya")
+    tour = sub.add_parser("tournament", help="turnamen bot vs bot paralel tanpa UI")
+    tour.add_argument("game", choices=sorted(TOURNAMENT_BOTS))
+    tour.add_argument("-s", "--strategies", nargs="+", default=None,
+                      help="bawaan: semua (" + "; ".join(f"{g}: {' '.join(b)}" for g, b in TOURNAMENT_BOTS.items()) + ")")
+    tour.add_argument("-n", "--games", type=int, default=TOURNAMENT_GAMES, help="pertandingan per pasangan")
+    tour.add_argument("--workers", type=int, default=None)
+    tour.add_argument("--chunk", type=int, default=TOURNAMENT_CHUNK)
+    tour.add_argument("--seed", type=int, default=0)
+    tour.add_argument("--board", dest="layout_board", default=None, help="file JSON papan Ular Tangga (bawaan: klasik)")
+    srv = sub.add_parser("serve", help="jalankan server relay multiplayer")
+    srv.add_argument("--host", default=NET_HOST)
+    srv.add_argument("--port", type=int, default=NET_PORT)
+    nb = sub.add_parser("net-bench", help="uji beban server relay di localhost (2 bot per room)")
+    nb.add_argument("--rooms", type=int, default=200)
+    nb.add_argument("--game", choices=["snakes", "ttt"], default="snakes")
+    nb.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+    board = None
+    board_path = getattr(args, "layout_board", None) or args.board
+    if board_path:
+        try:
+            board = load_board(board_path)
+        except (OSError, ValueError) as e:
+            parser.error(f"papan {board_path}: {e}")
+
+    if args.command == "simulate":
+        print(json.dumps(SIMULATORS[args.game](args.count, seed=args.seed), indent=2, ensure_ascii=False))
+        return
+    if args.command == "layout":
+        b = board or DEFAULT_BOARD
+        if args.exact:
+            result = analyze_layout_exact(b.ladders, b.snakes, b.size, players=args.players)
+        else:
+            result = simulate_layout(args.games, args.players, b.ladders, b.snakes, b.size, seed=args.seed)
+        print(json.dumps(result))
+        return
+    if args.command == "ttt-table":
+        table = build_ttt_table()
+        save_ttt_table(table, args.output)
+        print(f"{len(table)} posisi -> {args.output}")
+        return
+    if args.command == "search":
+        try:
+            result = search_layouts(args.candidates, args.target, args.players, args.ladders, args.snakes,
+                                    seed=args.seed, workers=args.workers, chunk=args.chunk,
+                                    top=args.top, mc_games=args.mc_games)
+        except ValueError as e:
+            parser.error(str(e))
+        text = json.dumps(result, indent=2)
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as f:
+                f.write(text)
+        else:
+            print(text)
+        return
+    if args.command == "replay":
+        if args.headless:
+            print(json.dumps(replay_headless(args.path), ensure_ascii=False))
+            return
+        if tk is None:
+            parser.error(TK_MISSING)
+        header, events = read_replay(args.path)
+        root = tk.Tk()
+        app = MultiGameApp(root)
+        view = app.open_game(header.game)
+        view.load_replay(header)
+        app.status.config(text=f"Replay {header.game}: {len(events)} event, seed {header.seed:016x}")
+        ReplayPlayer(root, view, events, args.speed,
+                     on_done=lambda: app.status.config(text="Replay selesai."))
+        root.mainloop()
+        return
+    if args.command == "plugins":
+        registry = default_registry()
+        if args.load:
+            registry.load_all()
+        print(json.dumps(registry.report(), indent=2, ensure_ascii=False))
+        return
+    if args.command == "tournament":
+        def progress(table):
+            print(f"\r{table.done}/{table.total} pertandingan", end="", file=sys.stderr, flush=True)
+        try:
+            result = run_tournament(args.game, args.strategies, args.games, args.seed, args.workers,
+                                    args.chunk, board, progress)
+        except ValueError as e:
+            parser.error(str(e))
+        print(file=sys.stderr)
+        print(json.dumps(result, indent=2, ensure_ascii=False))
+        return
+    if args.command == "serve":
+        run_relay_server(args.host, args.port)
+        return
+    if args.command == "net-bench":
+        print(json.dumps(net_bench(args.rooms, args.game, args.seed)))
+        return
+    if args.command == "bench":
+        results = run_benchmarks(args.reps, ui=not args.no_ui)
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        for name, r in results.items():
+            if name != "meta":
+                print(f"{name:<28}{r['median_ms']:>10.2f} ms")
+        if results["meta"].get("ui_skipped"):
+            print(f"UI dilewati: {results['meta']['ui_skipped']}")
+        if args.baseline:
+            with open(args.baseline, encoding="utf-8") as f:
+                regressions = compare_benchmarks(results, json.load(f), args.threshold)
+            for name, base, cur, ratio in regressions:
+                print(f"REGRESI {name}: {base:.2f} -> {cur:.2f} ms ({ratio:.2f}x)")
+            if regressions:
+                return 1
+        over = [(name, results[name]["median_ms"], budget) for name, budget in STARTUP_BUDGETS.items()
+                if name in results and results[name]["median_ms"] > budget]
+        for name, cur, budget in over:
+            print(f"ANGGARAN {name}: {cur:.2f} ms > {budget} ms")
+        return 1 if over else 0
+
+    net = None
+    if args.connect:
+        host, _, port = args.connect.rpartition(":")
+        net = (host or NET_HOST, int(port), args.room)
+    return run_app(net, board, args.startup_report)
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,52 @@
+# judul: Tebak Angka
+# status: Tebak Angka: tebak angka 1-100 dengan petunjuk lebih besar / lebih kecil.
+# Contoh plugin: file ini baru diimpor saat tombol "Tebak Angka" ditekan pertama kali.
+import random
+import tkinter as tk
+
+class GuessNumber:
+    def __init__(self, parent, app):
+        self.frame = tk.Frame(parent, bg="#222222")
+        tk.Label(self.frame, text="Tebak Angka", font=("Helvetica", 22, "bold"),
+                 fg="#ffffff", bg="#000000").pack(pady=(6, 10), fill="x")
+        app.nav_bar(self.frame, "tebak_angka")
+
+        self.info = tk.Label(self.frame, text="", font=("Helvetica", 13, "bold"),
+                             fg="#1b1b1b", bg="#ffdd77", padx=10, pady=6)
+        self.info.pack(pady=(0, 8), fill="x")
+
+        self.guess = tk.StringVar()
+        entry = tk.Entry(self.frame, textvariable=self.guess, font=("Helvetica", 18), width=8, justify="center")
+        entry.pack(pady=10)
+        entry.bind("<Return>", lambda e: self.submit())
+
+        controls = tk.Frame(self.frame, bg="#222222")
+        controls.pack(pady=8)
+        for col, (text, cmd) in enumerate([("Tebak", self.submit), ("Reset", self.reset)]):
+            tk.Button(controls, text=text, command=cmd, font=("Helvetica", 12, "bold"), fg="#ffffff",
+                      bg="#34495e", activebackground="#444444", bd=0, padx=14, pady=8).grid(row=0, column=col, padx=8)
+        self.reset()
+
+    def reset(self):
+        self.target = random.randint(1, 100)
+        self.tries = 0
+        self.guess.set("")
+        self.info.config(text="Tebak angka 1 sampai 100.")
+
+    def submit(self):
+        try:
+            value = int(self.guess.get())
+        except ValueError:
+            self.info.config(text="Masukkan angka bulat.")
+            return
+        self.tries += 1
+        if value < self.target:
+            self.info.config(text=f"{value} terlalu kecil.")
+        elif value > self.target:
+            self.info.config(text=f"{value} terlalu besar.")
+        else:
+            self.info.config(text=f"Benar! {value} ditebak dalam {self.tries} kali.")
+        self.guess.set("")
+
+def create(parent, app):
+    return GuessNumber(parent, app)
@@ -0,0 +1,22 @@
+import importlib.util
+import os
+import sys
+
+import pytest
+
+APP_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Multi Game App.py")
+
+
+def _load_app():
+    # Nama file berisi spasi, jadi dimuat lewat path; tkinter tidak dibutuhkan
+    if "multi_game_app" not in sys.modules:
+        spec = importlib.util.spec_from_file_location("multi_game_app", APP_PATH)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules["multi_game_app"] = module
+        spec.loader.exec_module(module)
+    return sys.modules["multi_game_app"]
+
+
+@pytest.fixture(scope="session")
+def mga():
+    return _load_app()
@@ -0,0 +1,25 @@
+import pytest
+
+
+def test_board_roundtrip(mga):
+    board = mga.board_from_dict({"name": "kecil", "size": 5, "players": 3,
+                                 "ladders": {"3": 12}, "snakes": {"20": 4}})
+    assert board.players == mga.SNAKES_PLAYERS[:3]
+    assert mga.board_from_dict(mga.board_to_dict(board)) == board
+
+
+@pytest.mark.parametrize("data", [
+    {"players": True},
+    {"players": 2.0},
+    {"players": "3"},
+    {"size": False},
+    {"size": 10.0},
+    {"size": 12.5},
+    {"ladders": {"3": 22.0}},
+    {"snakes": {"32": True}},
+    {"players": 0},
+    {"size": 31},
+])
+def test_board_rejects_bad_values(mga, data):
+    with pytest.raises(ValueError):
+        mga.board_from_dict(data)
@@ -0,0 +1,100 @@
+import random
+
+import pytest
+
+
+def test_snakes_ladder_and_snake(mga):
+    engine = mga.SnakesEngine(["A", "B"])
+    move = engine.roll(2)  # 1 + 2 = 3 -> tangga ke 22
+    assert (move.player, move.landed, move.end) == ("A", 3, 22)
+    assert engine.current_player == "B"
+    engine.positions["B"] = 30
+    move = engine.roll(2)  # 32 -> ular ke 10
+    assert (move.landed, move.end) == (32, 10)
+    assert engine.positions == {"A": 22, "B": 10}
+
+
+def test_snakes_exact_finish_and_winner(mga):
+    engine = mga.SnakesEngine(["A", "B"])
+    engine.positions["A"] = 99
+    move = engine.roll(3)  # lewat kotak terakhir: tetap di tempat
+    assert move.end == 99 and not engine.game_over
+    engine.roll(1)
+    move = engine.roll(1)
+    assert move.winner == "A" and engine.winner == "A"
+    assert engine.current_player == "A"  # giliran tidak maju setelah menang
+    assert engine.roll(1) is None
+
+
+def test_snakes_game_always_finishes(mga):
+    engine = mga.SnakesEngine(["A", "B", "C"], rng=random.Random(1))
+    while not engine.game_over:
+        engine.roll()
+    assert engine.positions[engine.winner] == engine.goal
+    assert engine.turns > 0
+
+
+def test_jump_table_matches_dicts(mga):
+    table = mga.jump_table(mga.DEFAULT_LADDERS, mga.DEFAULT_SNAKES)
+    assert len(table) == 101
+    for start, end in {**mga.DEFAULT_LADDERS, **mga.DEFAULT_SNAKES}.items():
+        assert table[start] == end
+    assert table[50] == 50
+
+
+@pytest.mark.parametrize("moves, winner, line", [
+    ([0, 3, 1, 4, 2], "X", (0, 1, 2)),
+    ([1, 0, 2, 4, 5, 8], "O", (0, 4, 8)),
+    ([3, 2, 0, 4, 1, 6], "O", (2, 4, 6)),
+])
+def test_ttt_winner(mga, moves, winner, line):
+    engine = mga.TicTacToeEngine()
+    for idx in moves:
+        assert engine.play(idx)
+    assert engine.winner == winner
+    assert engine.winning_line == line
+    assert not engine.play(7)
+
+
+def test_ttt_draw_and_illegal_move(mga):
+    engine = mga.TicTacToeEngine()
+    assert engine.play(4)
+    assert not engine.play(4)
+    for idx in [0, 2, 6, 3, 5, 1, 7, 8]:
+        engine.play(idx)
+    assert engine.draw and engine.winner is None and engine.game_over
+
+
+def test_ttt_large_variant_needs_win_len(mga):
+    engine = mga.TicTacToeEngine(5, 4)
+    for idx in [0, 20, 1, 21, 2, 22]:
+        engine.play(idx)
+    assert engine.winner is None
+    engine.play(3)
+    assert engine.winner == "X" and engine.winning_line == (0, 1, 2, 3)
+
+
+def test_ttt_table_roundtrip_and_truncated_file(mga, tmp_path):
+    path = str(tmp_path / "ttt_table.bin")
+    table = mga.build_ttt_table()
+    mga.save_ttt_table(table, path)
+    assert mga.load_ttt_table(path) == table
+    with open(path, "rb") as f:
+        data = f.read()
+    with open(path, "wb") as f:
+        f.write(data[:-5])
+    with pytest.raises(ValueError):
+        mga.load_ttt_table(path)
+    with open(path, "wb") as f:
+        f.write(data[:4] + mga.struct.pack("<H", 3) + data[6:6 + 3 * 11])
+    with pytest.raises(ValueError):
+        mga.load_ttt_table(path)
+
+
+def test_random_layout_counts(mga):
+    ladders, snakes = mga.random_layout(random.Random(0), 24, 25, 10)  # 98 kotak, pas
+    assert len(ladders) == 24 and len(snakes) == 25
+    with pytest.raises(ValueError, match="papan 10x10"):
+        mga.random_layout(random.Random(0), 25, 25, 10)
+    with pytest.raises(ValueError):
+        mga.search_layouts(4, 30, n_ladders=-1, workers=1)
@@ -0,0 +1,74 @@
+import random
+
+import pytest
+
+
+def test_snakes_roundtrip(mga, tmp_path):
+    seed = 1234
+    engine = mga.SnakesEngine(mga.SNAKES_PLAYERS[:2], rng=random.Random(seed))
+    log = mga.ReplayLog("snakes", seed, 2, directory=str(tmp_path))
+    while not engine.game_over:
+        log.append(mga.EV_ROLL, engine.roll().dice)
+    log.close()
+    result = mga.replay_headless(log.path)
+    assert result["events"] == engine.turns
+    assert result["state"] == {"positions": engine.positions, "winner": engine.winner, "turns": engine.turns}
+
+
+def test_snakes_roundtrip_with_board(mga, tmp_path):
+    board = mga.load_board(mga.os.path.join(mga.BOARDS_DIR, "keluarga-12x12.json"))
+    seed = 99
+    engine = mga.SnakesEngine(board.players, board.ladders, board.snakes, board.size, random.Random(seed))
+    log = mga.ReplayLog("snakes", seed, len(board.players), directory=str(tmp_path),
+                        board=mga.board_to_dict(board))
+    while not engine.game_over:
+        log.append(mga.EV_ROLL, engine.roll().dice)
+    log.close()
+    header, events = mga.read_replay(log.path)
+    assert mga.board_from_dict(header.board) == board
+    assert mga.replay_headless(log.path)["state"]["winner"] == engine.winner
+
+
+def test_ttt_roundtrip(mga, tmp_path):
+    log = mga.ReplayLog("ttt", 7, 3, 3, directory=str(tmp_path))
+    for idx in [4, 1, 8, 2, 0]:
+        log.append(mga.EV_CLICK, idx)
+    log.close()
+    state = mga.replay_headless(log.path)["state"]
+    assert state["winner"] == "X"
+    assert state["board"][0] == "X" and state["board"][1] == "O"
+
+
+def test_quiz_roundtrip(mga, tmp_path):
+    seed = 5
+    clock = [0.0]
+    engine = mga.QuizEngine(random.Random(seed), clock=lambda: clock[0])
+    log = mga.ReplayLog("quiz", seed, directory=str(tmp_path))
+    engine.new_question()
+    for i in range(30):
+        clock[0] += 2.5
+        answer = engine.current_answer if i % 3 else engine.current_answer + 1
+        engine.submit(answer)
+        log.append(mga.EV_ANSWER, answer, round(engine.last_response_s * 1000))
+        engine.new_question()
+    log.close()
+    state = mga.replay_headless(log.path)["state"]
+    assert state == {"score": engine.score, "total": engine.total, "tier": engine.tier}
+
+
+def test_replay_rejects_bad_data(mga, tmp_path):
+    with pytest.raises(ValueError):
+        mga.read_replay(b"XXXX" + bytes(mga.REPLAY_HEADER.size))
+    log = mga.ReplayLog("snakes", 1, 2, directory=str(tmp_path))
+    log.append(mga.EV_ROLL, 7)  # dadu mustahil: tidak cocok dengan seed
+    log.close()
+    with pytest.raises(ValueError):
+        mga.replay_headless(log.path)
+
+
+def test_replay_written_before_close(mga, tmp_path):
+    log = mga.ReplayLog("ttt", 3, 3, 3, directory=str(tmp_path))
+    log.append(mga.EV_CLICK, 4)
+    with open(log.path, "rb") as f:
+        assert len(f.read()) == mga.REPLAY_HEADER.size + mga.REPLAY_EVENT.size
+    log.close()